@@ -9,6 +9,7 @@ class Config:
     # Server/Concurrency
     APP_PORT: int = int(os.getenv("APP_PORT", "8000"))
     WORKERS: int = int(os.getenv("WORKERS", "4"))
+    THREAD_POOL_SIZE: int = int(os.getenv("THREAD_POOL_SIZE", "100"))
     REQUEST_TIMEOUT_S: int = int(os.getenv("REQUEST_TIMEOUT_S", "15"))
     MAX_QUEUE: int = int(os.getenv("MAX_QUEUE", "256"))
     
@@ -22,6 +23,9 @@ class Config:
     CHUNK_OVERLAP: int = int(os.getenv("CHUNK_OVERLAP", "256"))
     TABLE_AS_SEPARATE: bool = os.getenv("TABLE_AS_SEPARATE", "true").lower() == "true"
     FOOTNOTE_BACKLINK: bool = os.getenv("FOOTNOTE_BACKLINK", "true").lower() == "true"
+    # 디렉터리 전체 색인 시 Whoosh 일괄 쓰기 (프로세스 수, 배치당 청크 수)
+    WHOOSH_BULK_PROCS: int = int(os.getenv("WHOOSH_BULK_PROCS", "1"))
+    WHOOSH_BULK_BATCH_CHUNKS: int = int(os.getenv("WHOOSH_BULK_BATCH_CHUNKS", "5000"))
     
     # Embedding
     PRIMARY_EMBED: str = os.getenv("PRIMARY_EMBED", "BAAI/bge-m3")
@@ -41,6 +45,7 @@ class Config:
     # Reranker
     RERANKER_ID: str = os.getenv("RERANKER_ID", "jinaai/jina-reranker-v2-base-multilingual")
     RERANK_USE_ONNX: bool = os.getenv("RERANK_USE_ONNX", "true").lower() == "true"
+    RERANK_BATCH: int = int(os.getenv("RERANK_BATCH", "16"))
     
     # Generation (LLM)
     OLLAMA_HOST: str = os.getenv("OLLAMA_HOST", "http://localhost:11434")
@@ -48,6 +53,7 @@ class Config:
     GEN_TEMPERATURE: float = float(os.getenv("GEN_TEMPERATURE", "0.0"))
     GEN_TOP_P: float = float(os.getenv("GEN_TOP_P", "1.0"))
     GEN_MAX_TOKENS: int = int(os.getenv("GEN_MAX_TOKENS", "1024"))
+    GEN_TIMEOUT_S: int = int(os.getenv("GEN_TIMEOUT_S", "180"))
     
     # Accuracy Thresholds
     EVIDENCE_JACCARD: float = float(os.getenv("EVIDENCE_JACCARD", "0.55"))
@@ -65,6 +71,12 @@ class Config:
     TOPIC_CONFIDENCE_THRESHOLD: float = float(os.getenv("TOPIC_CONFIDENCE_THRESHOLD", "0.15"))  # More sensitive
     TOPIC_MIN_SCORE_THRESHOLD: float = float(os.getenv("TOPIC_MIN_SCORE_THRESHOLD", "0.05"))  # More sensitive
     TOPIC_DETECTION_ENABLED: bool = os.getenv("TOPIC_DETECTION_ENABLED", "true").lower() == "true"
+
+    # Semantic Answer Cache (opt-in until validated)
+    SEMANTIC_CACHE_ENABLED: bool = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD: float = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+    SEMANTIC_CACHE_TTL_S: int = int(os.getenv("SEMANTIC_CACHE_TTL_S", "300"))
+    SEMANTIC_CACHE_MAX_ENTRIES: int = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "64"))
     
     @classmethod
     def validate(cls):
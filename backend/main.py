@@ -2,12 +2,16 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 import logging
 from pathlib import Path
 
+import anyio.to_thread
+
 from config import config
 from routers import query, admin, documents, chat
+from rag.generator_ollama import get_http_client, close_http_client
 from utils.log_utils import setup_logging
 
 # Setup logging
@@ -20,6 +24,13 @@ async def lifespan(app: FastAPI):
     logger.info("Starting RAG Chatbot System...")
     config.validate()
     
+    # Size both worker pools for blocking stages run off the event loop
+    # (asyncio.to_thread for chat/admin work, anyio for sync endpoints)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=config.THREAD_POOL_SIZE)
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = config.THREAD_POOL_SIZE
+    
     # Initialize indexes if they don't exist
     from rag.whoosh_bm25 import WhooshBM25
     from rag.chroma_store import ChromaStore
@@ -27,12 +38,20 @@ async def lifespan(app: FastAPI):
     WhooshBM25.initialize()
     ChromaStore.initialize()
     
+    # Open the pooled Ollama client once for all generator instances
+    get_http_client()
+    
+    # Sample system metrics in the background for /api/admin/metrics
+    metrics_sampler = asyncio.create_task(admin.run_metrics_sampler())
+    
     logger.info("System ready!")
     
     yield
     
     # Shutdown
     logger.info("Shutting down...")
+    metrics_sampler.cancel()
+    await close_http_client()
 
 app = FastAPI(
     title="RAG Chatbot System",
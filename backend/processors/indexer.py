@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 import logging
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -130,8 +130,12 @@ class DocumentIndexer:
         finally:
             loop.close()
     
-    async def index_document(self, file_path: Path) -> Dict:
-        """Index a single document"""
+    async def index_document(self, file_path: Path, whoosh_batch: Optional[List[Dict]] = None) -> Dict:
+        """Index a single document
+
+        If whoosh_batch is given, the chunks are appended to it for a later
+        bulk Whoosh write instead of being indexed in Whoosh right away.
+        """
         logger.info(f"Indexing document: {file_path}")
         
         try:
@@ -241,14 +245,17 @@ class DocumentIndexer:
             
             logger.info(f"After deduplication: {len(chunks)} -> {len(normalized_chunks)} chunks")
             
-            # Index in Whoosh
-            try:
-                logger.info(f"Indexing {len(normalized_chunks)} chunks in Whoosh...")
-                self.whoosh.index_chunks(normalized_chunks)
-                logger.info(f"✓ Added {len(normalized_chunks)} chunks to Whoosh")
-            except Exception as e:
-                logger.error(f"Failed to index in Whoosh: {e}")
-                return {"status": "whoosh_error", "file": str(file_path), "error": str(e)}
+            # Index in Whoosh, or leave it to the caller's bulk write
+            if whoosh_batch is not None:
+                whoosh_batch.extend(normalized_chunks)
+            else:
+                try:
+                    logger.info(f"Indexing {len(normalized_chunks)} chunks in Whoosh...")
+                    self.whoosh.index_chunks(normalized_chunks)
+                    logger.info(f"✓ Added {len(normalized_chunks)} chunks to Whoosh")
+                except Exception as e:
+                    logger.error(f"Failed to index in Whoosh: {e}")
+                    return {"status": "whoosh_error", "file": str(file_path), "error": str(e)}
             
             # Generate embeddings and index in Chroma
             try:
@@ -335,15 +342,24 @@ class DocumentIndexer:
         
         logger.info(f"Found {len(documents)} documents to index")
         
-        # Index documents sequentially (to avoid overwhelming the system)
+        # Index documents sequentially (to avoid overwhelming the system);
+        # Whoosh chunks are collected and written in bounded bulk batches
+        whoosh_batch: List[Dict] = []
+        pending: List[Dict] = []
         for doc in documents:
-            result = await self.index_document(doc)
+            result = await self.index_document(doc, whoosh_batch=whoosh_batch)
             results.append(result)
             
             if result["status"] == "success":
+                pending.append(result)
                 logger.info(f"✓ Indexed: {result['file']} ({result['chunks']} chunks, {result.get('pages', 0)} pages)")
             else:
                 logger.warning(f"✗ Failed: {result['file']}: {result.get('error', 'Unknown error')}")
+            
+            if len(whoosh_batch) >= config.WHOOSH_BULK_BATCH_CHUNKS:
+                self._flush_whoosh_batch(whoosh_batch, pending)
+        
+        self._flush_whoosh_batch(whoosh_batch, pending)
         
         # Log summary
         successful = sum(1 for r in results if r["status"] == "success")
@@ -355,6 +371,27 @@ class DocumentIndexer:
         
         return results
 
+    def _flush_whoosh_batch(self, whoosh_batch: List[Dict], pending: List[Dict]):
+        """Write collected chunks to Whoosh and clear the batch
+        
+        If the write fails, the batch's documents are removed from ChromaDB
+        again so both indexes stay consistent, and their results are marked
+        as whoosh_error.
+        """
+        if whoosh_batch:
+            try:
+                self.whoosh.bulk_index_chunks(whoosh_batch)
+            except Exception as e:
+                logger.error(f"Failed to bulk index in Whoosh: {e}")
+                for doc_id in {chunk["doc_id"] for chunk in whoosh_batch}:
+                    self.chroma.delete_document(doc_id)
+                for result in pending:
+                    result.update(status="whoosh_error", error=str(e))
+                    logger.warning(f"✗ Failed: {result['file']}: {e}")
+        
+        whoosh_batch.clear()
+        pending.clear()
+
 async def index_all_documents():
     """Main function to index all documents"""
     indexer = DocumentIndexer()
@@ -5,6 +5,11 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# 인용 번호 패턴 ([1], [문서 1, 116])
+_CITATION_RE = re.compile(r'\[(\d+)\]')
+_DOC_CITATION_RE = re.compile(r'\[문서\s*(\d+),\s*\d+\]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 class AnswerFormatter:
     """Format answers according to 4-section schema"""
     
@@ -276,9 +281,10 @@ class AnswerFormatter:
         sources = response.get("sources", [])
 
         # Get valid citation numbers
+        allowed = frozenset(allowed_doc_ids)
         valid_citations = set()
         for idx, source in enumerate(sources, 1):
-            if source.get("doc_id") in allowed_doc_ids:
+            if source.get("doc_id") in allowed:
                 valid_citations.add(str(idx))
 
         # Remove invalid citations from answer
@@ -312,8 +318,7 @@ class AnswerFormatter:
             return response
 
         # Extract all citation numbers from answer
-        citation_pattern = re.compile(r'\[(\d+)\]')
-        cited_numbers = set(int(num) for num in citation_pattern.findall(answer_text))
+        cited_numbers = set(int(num) for num in _CITATION_RE.findall(answer_text))
 
         logger.info(f"Simple extraction found citations: {sorted(cited_numbers)}")
 
@@ -345,10 +350,10 @@ class AnswerFormatter:
                 return ""  # Remove invalid citation
 
         # Replace invalid citations
-        cleaned_text = re.sub(r'\[(\d+)\]', replace_citation, text)
+        cleaned_text = _CITATION_RE.sub(replace_citation, text)
 
         # Clean up extra spaces
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
+        cleaned_text = _WHITESPACE_RE.sub(' ', cleaned_text).strip()
 
         return cleaned_text
 
@@ -452,30 +457,20 @@ class AnswerFormatter:
                 renumber_map[old_num] = new_index
                 new_index += 1
         
-        # Update citation numbers in the answer text
+        # Update citation numbers in a single pass per text
+        def renumber(match):
+            new_num = renumber_map.get(int(match.group(1)))
+            return f'[{new_num}]' if new_num is not None else match.group(0)
+
         if renumber_map and response.get("answer"):
-            answer_text = response["answer"]
-            for old_num, new_num in sorted(renumber_map.items(), reverse=True):
-                # Replace [old_num] with [new_num]
-                answer_text = re.sub(rf'\[{old_num}\]', f'[{new_num}]', answer_text)
-            response["answer"] = answer_text
-        
-        # Update citation numbers in key_facts
+            response["answer"] = _CITATION_RE.sub(renumber, response["answer"])
+
         if renumber_map and response.get("key_facts"):
-            updated_facts = []
-            for fact in response["key_facts"]:
-                for old_num, new_num in sorted(renumber_map.items(), reverse=True):
-                    fact = re.sub(rf'\[{old_num}\]', f'[{new_num}]', fact)
-                updated_facts.append(fact)
-            response["key_facts"] = updated_facts
-        
-        # Update citation numbers in details
+            response["key_facts"] = [_CITATION_RE.sub(renumber, fact) for fact in response["key_facts"]]
+
         if renumber_map and response.get("details"):
-            details = response["details"]
-            for old_num, new_num in sorted(renumber_map.items(), reverse=True):
-                details = re.sub(rf'\[{old_num}\]', f'[{new_num}]', details)
-            response["details"] = details
-        
+            response["details"] = _CITATION_RE.sub(renumber, response["details"])
+
         response["sources"] = cited_sources
         response["citation_map"] = renumber_map
 
@@ -495,25 +490,22 @@ class AnswerFormatter:
 
         # Extract all citation numbers from answer text in order of appearance
         # Handle both [숫자] and [문서 숫자, 페이지] patterns
-        citation_pattern = re.compile(r'\[(\d+)\]')
-        doc_citation_pattern = re.compile(r'\[문서\s*(\d+),\s*\d+\]')
-
         # Process answer - look for both patterns
-        citations_in_answer = citation_pattern.findall(answer_text)
-        doc_citations_in_answer = doc_citation_pattern.findall(answer_text)
+        citations_in_answer = _CITATION_RE.findall(answer_text)
+        doc_citations_in_answer = _DOC_CITATION_RE.findall(answer_text)
         citations_in_answer.extend(doc_citations_in_answer)
 
         # Process key facts
         citations_in_facts = []
         for fact in key_facts:
-            citations_in_facts.extend(citation_pattern.findall(fact))
-            citations_in_facts.extend(doc_citation_pattern.findall(fact))
+            citations_in_facts.extend(_CITATION_RE.findall(fact))
+            citations_in_facts.extend(_DOC_CITATION_RE.findall(fact))
 
         # Process details
         citations_in_details = []
         if details:
-            citations_in_details.extend(citation_pattern.findall(details))
-            citations_in_details.extend(doc_citation_pattern.findall(details))
+            citations_in_details.extend(_CITATION_RE.findall(details))
+            citations_in_details.extend(_DOC_CITATION_RE.findall(details))
 
         # Combine all citations while preserving order
         all_citations = citations_in_answer + citations_in_facts + citations_in_details
@@ -540,27 +532,27 @@ class AnswerFormatter:
         # Update answer text - replace both patterns
         if answer_text:
             # First replace [문서 X, Y] with [X]
-            answer_text = doc_citation_pattern.sub(lambda m: f"[{m.group(1)}]", answer_text)
+            answer_text = _DOC_CITATION_RE.sub(lambda m: f"[{m.group(1)}]", answer_text)
             # Then apply the renumbering
-            response["answer"] = citation_pattern.sub(replace_citation, answer_text)
+            response["answer"] = _CITATION_RE.sub(replace_citation, answer_text)
 
         # Update key facts
         if key_facts:
             new_facts = []
             for fact in key_facts:
                 # First replace [문서 X, Y] with [X]
-                fact = doc_citation_pattern.sub(lambda m: f"[{m.group(1)}]", fact)
+                fact = _DOC_CITATION_RE.sub(lambda m: f"[{m.group(1)}]", fact)
                 # Then apply renumbering
-                fact = citation_pattern.sub(replace_citation, fact)
+                fact = _CITATION_RE.sub(replace_citation, fact)
                 new_facts.append(fact)
             response["key_facts"] = new_facts
 
         # Update details
         if details:
             # First replace [문서 X, Y] with [X]
-            details = doc_citation_pattern.sub(lambda m: f"[{m.group(1)}]", details)
+            details = _DOC_CITATION_RE.sub(lambda m: f"[{m.group(1)}]", details)
             # Then apply renumbering
-            response["details"] = citation_pattern.sub(replace_citation, details)
+            response["details"] = _CITATION_RE.sub(replace_citation, details)
 
         # Reorder sources based on new citation numbers
         cited_sources = []
@@ -593,8 +585,8 @@ class AnswerFormatter:
             return False
         
         # Normalize both texts
-        norm_answer = re.sub(r'\s+', ' ', answer_text.lower())
-        norm_source = re.sub(r'\s+', ' ', source_text.lower())
+        norm_answer = _WHITESPACE_RE.sub(' ', answer_text.lower())
+        norm_source = _WHITESPACE_RE.sub(' ', source_text.lower())
         
         # Extract key terms from answer (Korean words > 2 chars)
         answer_words = set(re.findall(r'[가-힣]{3,}', norm_answer))
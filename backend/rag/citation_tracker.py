@@ -3,9 +3,10 @@ from typing import Dict, List, Tuple, Optional
 import json
 import logging
 import numpy as np
-import unicodedata
 from sentence_transformers import SentenceTransformer
 
+from utils.text import nfc_doc_id
+
 logger = logging.getLogger(__name__)
 
 class CitationTracker:
@@ -85,7 +86,7 @@ class CitationTracker:
         
         for idx, evidence in enumerate(evidences, 1):
             raw_id = evidence.get('doc_id', '') or ''
-            norm_id = unicodedata.normalize('NFC', str(raw_id).strip())
+            norm_id = nfc_doc_id(str(raw_id).strip())
             key = f"{norm_id}_{evidence.get('page', 0)}"
             citation_map[key] = {
                 "index": idx,
@@ -104,7 +105,7 @@ class CitationTracker:
         deduped: List[Dict] = []
         for s in sources or []:
             raw_id = s.get('doc_id') or s.get('metadata', {}).get('doc_id') or ''
-            norm_id = unicodedata.normalize('NFC', str(raw_id).strip())
+            norm_id = nfc_doc_id(str(raw_id).strip())
             page = s.get('page', 0)
             chunk_id = s.get('chunk_id', '')
             key = (norm_id, page, chunk_id)
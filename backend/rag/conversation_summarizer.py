@@ -92,7 +92,8 @@ class ConversationSummarizer:
         Works for ANY domain (departments, locations, organizations, etc.) without
         hardcoding specific suffixes or entity types.
         """
-        entities: List[str] = []
+        # dict keeps first-seen order with O(1) duplicate checks
+        entities: Dict[str, None] = {}
 
         for message in messages:
             if message.get("role") != "assistant":
@@ -109,12 +110,12 @@ class ConversationSummarizer:
                 # Filter using morphological heuristics (NO domain knowledge)
                 if self._is_likely_entity(word):
                     cleaned = word.strip().strip(',')
-                    if cleaned and cleaned not in entities:
-                        entities.append(cleaned)
+                    if cleaned:
+                        entities.setdefault(cleaned)
 
         # Apply statistical clustering to normalize variants
         # Example: "문화과", "문화과에서" -> "문화과"
-        return self._normalize_entities_statistical(entities)
+        return self._normalize_entities_statistical(list(entities))
 
     def _is_likely_entity(self, word: str) -> bool:
         """
@@ -163,18 +164,14 @@ class ConversationSummarizer:
                 clusters.append({entity})
 
         # Select canonical form from each cluster (shortest = root)
+        position = {entity: idx for idx, entity in enumerate(entities)}
         normalized = []
         for cluster in clusters:
             cluster_list = list(cluster)
-            canonical = min(cluster_list, key=lambda x: (len(x), entities.index(x) if x in entities else 999))
+            canonical = min(cluster_list, key=lambda x: (len(x), position.get(x, 999)))
             normalized.append(canonical)
 
         return normalized
 
     def _merge_entities(self, previous: List[str], current: List[str]) -> List[str]:
-        merged: List[str] = []
-        for source in (previous, current):
-            for entity in source:
-                if entity not in merged:
-                    merged.append(entity)
-        return merged
+        return list(dict.fromkeys([*previous, *current]))
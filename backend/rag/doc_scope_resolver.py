@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 import logging
@@ -219,28 +220,33 @@ class DocScopeResolver:
             and doc_scope_mode == "followup"
             and previous_scope
         ):
-            expanded_evidences = self._safe_retrieve(
-                retriever,
-                retrieval_query,
-                topk,
-                session_scope if session_scope else None,
-            )
-            unbounded_evidences = []
             if session_scope:
-                # Avoid redundant retrieval when session scope already equals previous scope
-                if set(session_scope) != set(previous_scope):
-                    diagnostics["expanded_count"] = len(expanded_evidences)
-                else:
-                    diagnostics["expanded_count"] = len(expanded_evidences)
+                # 세션 범위 검색과 전체 검색은 서로 독립적이므로 동시에 실행
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    unbounded_future = executor.submit(
+                        self._safe_retrieve,
+                        retriever,
+                        retrieval_query,
+                        topk,
+                        None,
+                    )
+                    expanded_evidences = self._safe_retrieve(
+                        retriever,
+                        retrieval_query,
+                        topk,
+                        session_scope,
+                    )
+                    unbounded_evidences = unbounded_future.result()
             else:
-                diagnostics["expanded_count"] = len(expanded_evidences)
-            # Always allow an unbounded peek to detect completely new docs
-            unbounded_evidences = self._safe_retrieve(
-                retriever,
-                retrieval_query,
-                topk,
-                None,
-            )
+                # 세션 범위가 없으면 확장 검색이 곧 전체 검색
+                expanded_evidences = self._safe_retrieve(
+                    retriever,
+                    retrieval_query,
+                    topk,
+                    None,
+                )
+                unbounded_evidences = expanded_evidences
+            diagnostics["expanded_count"] = len(expanded_evidences)
             diagnostics["unbounded_count"] = len(unbounded_evidences)
 
             analysis: TopicChangeAnalysis = self.topic_detector.analyze(
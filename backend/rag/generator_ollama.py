@@ -10,6 +10,27 @@ from rag.prompt_templates import PromptTemplates
 
 logger = logging.getLogger(__name__)
 
+# One keep-alive pool shared by every generator instance; timeouts are per request
+_http_client: Optional[httpx.AsyncClient] = None
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=60)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared client for Ollama calls, created on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(limits=_HTTP_LIMITS)
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared client on shutdown"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 class OllamaGenerator:
     """Ollama-based text generator with streaming support"""
 
@@ -22,26 +43,31 @@ class OllamaGenerator:
         self.timeout = httpx.Timeout(120.0, connect=10.0)  # Increase timeout for slower models
         self.use_chat_api = None  # Will be determined on first call
     
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return get_http_client()
+    
     async def _detect_api_version(self) -> bool:
         """Detect if Ollama supports /api/chat (v0.1.14+)"""
         if self.use_chat_api is not None:
             return self.use_chat_api
 
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
-                # Try chat API with a minimal request
-                test_request = {
-                    "model": self.model,
-                    "messages": [{"role": "user", "content": "test"}],
-                    "stream": False
-                }
-                response = await client.post(
-                    f"{self.base_url}/api/chat",
-                    json=test_request
-                )
-                self.use_chat_api = (response.status_code != 404)
-                logger.info(f"Ollama API version detected: {'chat' if self.use_chat_api else 'generate'}")
-                return self.use_chat_api
+            client = self.client
+            # Try chat API with a minimal request
+            test_request = {
+                "model": self.model,
+                "messages": [{"role": "user", "content": "test"}],
+                "stream": False
+            }
+            response = await client.post(
+                f"{self.base_url}/api/chat",
+                json=test_request,
+                timeout=httpx.Timeout(5.0)
+            )
+            self.use_chat_api = (response.status_code != 404)
+            logger.info(f"Ollama API version detected: {'chat' if self.use_chat_api else 'generate'}")
+            return self.use_chat_api
         except Exception as e:
             logger.warning(f"API detection failed, defaulting to /api/generate: {e}")
             self.use_chat_api = False
@@ -92,77 +118,24 @@ class OllamaGenerator:
     
     async def _generate_complete(self, request_data: Dict) -> Dict:
         """Generate complete response"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                if self.use_chat_api:
-                    # Use /api/chat endpoint (v0.1.14+)
-                    response = await client.post(
-                        f"{self.base_url}/api/chat",
-                        json=request_data
-                    )
-
-                    if response.status_code != 200:
-                        raise Exception(f"Ollama returned {response.status_code}")
-
-                    result = response.json()
-                    content = result.get("message", {}).get("content", "")
-                else:
-                    # Use /api/generate endpoint (older versions)
-                    # Convert messages to single prompt
-                    system_msg = next((m["content"] for m in request_data["messages"] if m["role"] == "system"), "")
-                    user_msg = next((m["content"] for m in request_data["messages"] if m["role"] == "user"), "")
-                    combined_prompt = f"{system_msg}\n\n{user_msg}" if system_msg else user_msg
-
-                    generate_request = {
-                        "model": request_data["model"],
-                        "prompt": combined_prompt,
-                        "temperature": request_data.get("temperature", 0.0),
-                        "top_p": request_data.get("top_p", 1.0),
-                        "stream": False
-                    }
-
-                    response = await client.post(
-                        f"{self.base_url}/api/generate",
-                        json=generate_request
-                    )
-
-                    if response.status_code != 200:
-                        raise Exception(f"Ollama returned {response.status_code}")
-
-                    result = response.json()
-                    content = result.get("response", "")
-
-                # Try to parse structured response
-                parsed = self._parse_response(content)
-
-                return parsed
-
-            except httpx.ConnectError:
-                logger.error("Cannot connect to Ollama. Is it running?")
-                raise Exception("Ollama 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-    
-    async def _generate_stream(self, request_data: Dict) -> AsyncIterator[str]:
-        """Generate streaming response"""
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        client = self.client
+        try:
             if self.use_chat_api:
                 # Use /api/chat endpoint (v0.1.14+)
-                async with client.stream(
-                    "POST",
+                response = await client.post(
                     f"{self.base_url}/api/chat",
-                    json=request_data
-                ) as response:
-                    async for line in response.aiter_lines():
-                        if line:
-                            try:
-                                data = json.loads(line)
-                                if "message" in data:
-                                    content = data["message"].get("content", "")
-                                    if content:
-                                        yield content
-                            except json.JSONDecodeError:
-                                continue
+                    json=request_data,
+                    timeout=self.timeout
+                )
+
+                if response.status_code != 200:
+                    raise Exception(f"Ollama returned {response.status_code}")
+
+                result = response.json()
+                content = result.get("message", {}).get("content", "")
             else:
                 # Use /api/generate endpoint (older versions)
+                # Convert messages to single prompt
                 system_msg = next((m["content"] for m in request_data["messages"] if m["role"] == "system"), "")
                 user_msg = next((m["content"] for m in request_data["messages"] if m["role"] == "user"), "")
                 combined_prompt = f"{system_msg}\n\n{user_msg}" if system_msg else user_msg
@@ -172,23 +145,80 @@ class OllamaGenerator:
                     "prompt": combined_prompt,
                     "temperature": request_data.get("temperature", 0.0),
                     "top_p": request_data.get("top_p", 1.0),
-                    "stream": True
+                    "stream": False
                 }
 
-                async with client.stream(
-                    "POST",
+                response = await client.post(
                     f"{self.base_url}/api/generate",
-                    json=generate_request
-                ) as response:
-                    async for line in response.aiter_lines():
-                        if line:
-                            try:
-                                data = json.loads(line)
-                                content = data.get("response", "")
+                    json=generate_request,
+                    timeout=self.timeout
+                )
+
+                if response.status_code != 200:
+                    raise Exception(f"Ollama returned {response.status_code}")
+
+                result = response.json()
+                content = result.get("response", "")
+
+            # Try to parse structured response
+            parsed = self._parse_response(content)
+
+            return parsed
+
+        except httpx.ConnectError:
+            logger.error("Cannot connect to Ollama. Is it running?")
+            raise Exception("Ollama 서버에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
+    
+    async def _generate_stream(self, request_data: Dict) -> AsyncIterator[str]:
+        """Generate streaming response"""
+        client = self.client
+        if self.use_chat_api:
+            # Use /api/chat endpoint (v0.1.14+)
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/api/chat",
+                json=request_data,
+                timeout=self.timeout
+            ) as response:
+                async for line in response.aiter_lines():
+                    if line:
+                        try:
+                            data = json.loads(line)
+                            if "message" in data:
+                                content = data["message"].get("content", "")
                                 if content:
                                     yield content
-                            except json.JSONDecodeError:
-                                continue
+                        except json.JSONDecodeError:
+                            continue
+        else:
+            # Use /api/generate endpoint (older versions)
+            system_msg = next((m["content"] for m in request_data["messages"] if m["role"] == "system"), "")
+            user_msg = next((m["content"] for m in request_data["messages"] if m["role"] == "user"), "")
+            combined_prompt = f"{system_msg}\n\n{user_msg}" if system_msg else user_msg
+
+            generate_request = {
+                "model": request_data["model"],
+                "prompt": combined_prompt,
+                "temperature": request_data.get("temperature", 0.0),
+                "top_p": request_data.get("top_p", 1.0),
+                "stream": True
+            }
+
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/api/generate",
+                json=generate_request,
+                timeout=self.timeout
+            ) as response:
+                async for line in response.aiter_lines():
+                    if line:
+                        try:
+                            data = json.loads(line)
+                            content = data.get("response", "")
+                            if content:
+                                yield content
+                        except json.JSONDecodeError:
+                            continue
     
     def _parse_response(self, content: str) -> Dict:
         """Parse LLM response into structured format
@@ -377,89 +407,91 @@ class OllamaGenerator:
         await self._detect_api_version()
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                if self.use_chat_api:
-                    # Use /api/chat endpoint (v0.1.14+)
-                    async with client.stream(
-                        'POST',
-                        f"{self.base_url}/api/chat",
-                        json=request_data
-                    ) as response:
-                        response.raise_for_status()
-
-                        # DEBUG: Collect raw response for logging
-                        raw_response_parts = []
-
-                        async for line in response.aiter_lines():
-                            # Check cancellation
-                            if cancel_event and cancel_event.is_set():
-                                break
-
-                            if line:
-                                try:
-                                    data = json.loads(line)
-                                    if data.get("message", {}).get("content"):
-                                        content = data["message"]["content"]
-                                        raw_response_parts.append(content)
-                                        yield content
-                                except json.JSONDecodeError:
-                                    continue
-
-                        # DEBUG: Log the complete raw response
-                        if raw_response_parts:
-                            full_raw_response = ''.join(raw_response_parts)
-                            logger.info("="*80)
-                            logger.info("DEBUG: RAW MODEL RESPONSE FROM OLLAMA")
-                            logger.info("="*80)
-                            logger.info(f"{full_raw_response[:2000]}...")
-                            logger.info("="*80)
-                else:
-                    # Use /api/generate endpoint (older versions)
-                    system_msg = messages[0]["content"] if messages and messages[0]["role"] == "system" else ""
-                    user_msg = messages[1]["content"] if len(messages) > 1 else ""
-                    combined_prompt = f"{system_msg}\n\n{user_msg}" if system_msg else user_msg
-
-                    generate_request = {
-                        "model": request_data["model"],
-                        "prompt": combined_prompt,
-                        "temperature": request_data.get("temperature", 0.0),
-                        "top_p": request_data.get("top_p", 1.0),
-                        "stream": True
-                    }
-
-                    async with client.stream(
-                        'POST',
-                        f"{self.base_url}/api/generate",
-                        json=generate_request
-                    ) as response:
-                        response.raise_for_status()
-
-                        # DEBUG: Collect raw response for logging
-                        raw_response_parts = []
-
-                        async for line in response.aiter_lines():
-                            # Check cancellation
-                            if cancel_event and cancel_event.is_set():
-                                break
-
-                            if line:
-                                try:
-                                    data = json.loads(line)
-                                    content = data.get("response", "")
-                                    if content:
-                                        raw_response_parts.append(content)
-                                        yield content
-                                except json.JSONDecodeError:
-                                    continue
-
-                        # DEBUG: Log the complete raw response
-                        if raw_response_parts:
-                            full_raw_response = ''.join(raw_response_parts)
-                            logger.info("="*80)
-                            logger.info("DEBUG: RAW MODEL RESPONSE FROM OLLAMA")
-                            logger.info("="*80)
-                            logger.info(f"{full_raw_response[:2000]}...")
-                            logger.info("="*80)
+            client = self.client
+            if self.use_chat_api:
+                # Use /api/chat endpoint (v0.1.14+)
+                async with client.stream(
+                    'POST',
+                    f"{self.base_url}/api/chat",
+                    json=request_data,
+                    timeout=self.timeout
+                ) as response:
+                    response.raise_for_status()
+
+                    # DEBUG: Collect raw response for logging
+                    raw_response_parts = []
+
+                    async for line in response.aiter_lines():
+                        # Check cancellation
+                        if cancel_event and cancel_event.is_set():
+                            break
+
+                        if line:
+                            try:
+                                data = json.loads(line)
+                                if data.get("message", {}).get("content"):
+                                    content = data["message"]["content"]
+                                    raw_response_parts.append(content)
+                                    yield content
+                            except json.JSONDecodeError:
+                                continue
+
+                    # DEBUG: Log the complete raw response
+                    if raw_response_parts:
+                        full_raw_response = ''.join(raw_response_parts)
+                        logger.info("="*80)
+                        logger.info("DEBUG: RAW MODEL RESPONSE FROM OLLAMA")
+                        logger.info("="*80)
+                        logger.info(f"{full_raw_response[:2000]}...")
+                        logger.info("="*80)
+            else:
+                # Use /api/generate endpoint (older versions)
+                system_msg = messages[0]["content"] if messages and messages[0]["role"] == "system" else ""
+                user_msg = messages[1]["content"] if len(messages) > 1 else ""
+                combined_prompt = f"{system_msg}\n\n{user_msg}" if system_msg else user_msg
+
+                generate_request = {
+                    "model": request_data["model"],
+                    "prompt": combined_prompt,
+                    "temperature": request_data.get("temperature", 0.0),
+                    "top_p": request_data.get("top_p", 1.0),
+                    "stream": True
+                }
+
+                async with client.stream(
+                    'POST',
+                    f"{self.base_url}/api/generate",
+                    json=generate_request,
+                    timeout=self.timeout
+                ) as response:
+                    response.raise_for_status()
+
+                    # DEBUG: Collect raw response for logging
+                    raw_response_parts = []
+
+                    async for line in response.aiter_lines():
+                        # Check cancellation
+                        if cancel_event and cancel_event.is_set():
+                            break
+
+                        if line:
+                            try:
+                                data = json.loads(line)
+                                content = data.get("response", "")
+                                if content:
+                                    raw_response_parts.append(content)
+                                    yield content
+                            except json.JSONDecodeError:
+                                continue
+
+                    # DEBUG: Log the complete raw response
+                    if raw_response_parts:
+                        full_raw_response = ''.join(raw_response_parts)
+                        logger.info("="*80)
+                        logger.info("DEBUG: RAW MODEL RESPONSE FROM OLLAMA")
+                        logger.info("="*80)
+                        logger.info(f"{full_raw_response[:2000]}...")
+                        logger.info("="*80)
 
         except Exception as e:
             logger.error(f"Stream generation with context failed: {e}")
@@ -468,8 +500,8 @@ class OllamaGenerator:
     async def check_health(self) -> bool:
         """Check if Ollama is available"""
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(5.0)) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
-        except:
+            client = self.client
+            response = await client.get(f"{self.base_url}/api/tags", timeout=httpx.Timeout(5.0))
+            return response.status_code == 200
+        except Exception:
             return False
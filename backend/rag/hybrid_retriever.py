@@ -1,9 +1,11 @@
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, FrozenSet, Optional, Tuple
 import numpy as np
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+import hashlib
 import logging
+import threading
 import re
-import unicodedata
 from rapidfuzz import fuzz
 
 from config import config
@@ -11,9 +13,20 @@ from rag.whoosh_bm25 import WhooshBM25
 from rag.chroma_store import ChromaStore
 from rag.embedder import Embedder
 from processors.normalizer_govkr import NormalizerGovKR
+from utils.cache import retrieval_cache
+from utils.text import nfc_doc_id
 
 logger = logging.getLogger(__name__)
 
+# Query embeddings kept per retriever, keyed by a digest of the query text
+QUERY_EMBEDDING_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=256)
+def _doc_id_filter(document_ids: Tuple[str, ...]) -> FrozenSet[str]:
+    """Normalized document scope, built once per distinct session scope"""
+    return frozenset(nfc_doc_id(doc_id) for doc_id in document_ids)
+
 class HybridRetriever:
     """Hybrid retriever combining BM25 and vector search with RRF"""
     
@@ -30,9 +43,48 @@ class HybridRetriever:
         self.w_bm25 = config.W_BM25
         self.w_vector = config.W_VECTOR
         self.w_rerank = config.W_RERANK
+        
+        self._query_embeddings: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._query_embeddings_lock = threading.Lock()
+    
+    def embed_query(self, query: str) -> np.ndarray:
+        """Encode a query, reusing the vector for repeated query strings"""
+        key = hashlib.blake2b(query.encode("utf-8"), digest_size=16).digest()
+        with self._query_embeddings_lock:
+            embedding = self._query_embeddings.get(key)
+            if embedding is not None:
+                self._query_embeddings.move_to_end(key)
+                return embedding
+        
+        embedding = np.asarray(self.embedder.encode_query(query))
+        if not embedding.any():
+            # The embedder returns a zero vector on failure; don't keep it
+            return embedding
+        # Shared between callers, so guard against in-place modification
+        embedding.setflags(write=False)
+        
+        with self._query_embeddings_lock:
+            self._query_embeddings[key] = embedding
+            while len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embeddings.popitem(last=False)
+        return embedding
     
     def retrieve(self, query: str, limit: int = 10, document_ids: Optional[List[str]] = None) -> List[Dict]:
-        """Retrieve documents using hybrid search with optional document filtering"""
+        """Retrieve documents using hybrid search with optional document filtering
+
+        Identical (query, scope, limit) probes within a few seconds, e.g. the
+        scope and topic-change probes of one turn, share a cached result.
+        Each caller gets its own copies of the evidence dicts.
+        """
+        key = (query, tuple(sorted(document_ids)) if document_ids else (), limit)
+        cached = retrieval_cache.get(key)
+        if cached is None:
+            cached = self._retrieve_uncached(query, limit, document_ids)
+            retrieval_cache.set(key, [dict(result) for result in cached])
+            return cached
+        return [dict(result) for result in cached]
+
+    def _retrieve_uncached(self, query: str, limit: int, document_ids: Optional[List[str]]) -> List[Dict]:
         # Normalize query
         normalized_query = self.normalizer.normalize_query(query)
 
@@ -40,12 +92,14 @@ class HybridRetriever:
         query_keywords = self._extract_keywords(query)
         self._last_keywords = query_keywords  # Store for logging
 
+        doc_id_set = _doc_id_filter(tuple(document_ids)) if document_ids else None
+
         # BM25 search
-        bm25_results = self._bm25_search(normalized_query, document_ids)
+        bm25_results = self._bm25_search(normalized_query, doc_id_set)
         self._last_bm25_count = len(bm25_results)  # Store for logging
 
         # Vector search
-        vector_results = self._vector_search(query, document_ids)  # Use original query for embedding
+        vector_results = self._vector_search(query, doc_id_set)  # Use original query for embedding
         self._last_vector_count = len(vector_results)  # Store for logging
 
         # Combine with RRF
@@ -70,28 +124,21 @@ class HybridRetriever:
         # Return top results
         return diverse_results
     
-    def _bm25_search(self, query: str, document_ids: Optional[List[str]] = None) -> List[Dict]:
+    def _bm25_search(self, query: str, doc_id_set: Optional[FrozenSet[str]] = None) -> List[Dict]:
         """Perform BM25 search with optional document filtering"""
         try:
             # Get more results initially to ensure we capture all documents
             # When filtering by document_ids, get more results to ensure we find mentions in all docs
-            search_limit = config.TOPK_BM25 * 3 if document_ids else config.TOPK_BM25 * 2
+            search_limit = config.TOPK_BM25 * 3 if doc_id_set else config.TOPK_BM25 * 2
             results = self.bm25.search(query, limit=search_limit)
 
             # Filter by document IDs if provided
-            if document_ids:
-                # Normalize Unicode for comparison (handle NFD vs NFC)
-                normalized_doc_ids = set(unicodedata.normalize('NFC', doc_id) for doc_id in document_ids)
-
+            if doc_id_set:
                 # Log for debugging
-                logger.debug(f"Filter doc IDs (normalized): {normalized_doc_ids}")
+                logger.debug(f"Filter doc IDs (normalized): {doc_id_set}")
                 logger.debug(f"First 3 result doc IDs: {[r.get('doc_id', '') for r in results[:3]]}")
 
-                filtered_results = []
-                for r in results:
-                    result_doc_id = unicodedata.normalize('NFC', r.get("doc_id", ""))
-                    if result_doc_id in normalized_doc_ids:
-                        filtered_results.append(r)
+                filtered_results = [r for r in results if nfc_doc_id(r.get("doc_id", "")) in doc_id_set]
 
                 logger.info(f"BM25 filtering: {len(results)} -> {len(filtered_results)} results")
                 results = filtered_results
@@ -113,28 +160,21 @@ class HybridRetriever:
             logger.error(f"BM25 search failed: {e}")
             return []
     
-    def _vector_search(self, query: str, document_ids: Optional[List[str]] = None) -> List[Dict]:
+    def _vector_search(self, query: str, doc_id_set: Optional[FrozenSet[str]] = None) -> List[Dict]:
         """Perform vector similarity search with optional document filtering"""
         try:
             # Generate query embedding
-            query_embedding = self.embedder.encode_query(query)
+            query_embedding = self.embed_query(query)
 
             # Search in ChromaDB - get more results to ensure comprehensive coverage
             results = self.chroma.search(
                 query_embedding.tolist(),
-                limit=config.TOPK_VECTOR * 3 if document_ids else config.TOPK_VECTOR * 2
+                limit=config.TOPK_VECTOR * 3 if doc_id_set else config.TOPK_VECTOR * 2
             )
 
             # Filter by document IDs if provided
-            if document_ids:
-                # Normalize Unicode for comparison (handle NFD vs NFC)
-                normalized_doc_ids = set(unicodedata.normalize('NFC', doc_id) for doc_id in document_ids)
-
-                filtered_results = []
-                for r in results:
-                    result_doc_id = unicodedata.normalize('NFC', r.get("doc_id", ""))
-                    if result_doc_id in normalized_doc_ids:
-                        filtered_results.append(r)
+            if doc_id_set:
+                filtered_results = [r for r in results if nfc_doc_id(r.get("doc_id", "")) in doc_id_set]
 
                 logger.info(f"Vector filtering: {len(results)} -> {len(filtered_results)} results")
                 results = filtered_results[:config.TOPK_VECTOR]
@@ -199,14 +239,16 @@ class HybridRetriever:
         results = self.retrieve(query, limit=limit * 2)  # Get more to account for filtering
         
         # Apply filters
+        allowed_docs = frozenset(doc_ids) if doc_ids else None
+        allowed_types = frozenset(doc_types) if doc_types else None
         filtered_results = []
         for result in results:
             # Filter by document IDs
-            if doc_ids and result.get("doc_id") not in doc_ids:
+            if allowed_docs and result.get("doc_id") not in allowed_docs:
                 continue
             
             # Filter by document types
-            if doc_types and result.get("type") not in doc_types:
+            if allowed_types and result.get("type") not in allowed_types:
                 continue
             
             filtered_results.append(result)
@@ -15,9 +15,16 @@ class Reranker:
     def __init__(self):
         self.model = None
         self.tokenizer = None
+        self.ort_session = None
         self.use_onnx = config.RERANK_USE_ONNX
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self._initialize_model()
+        # Resolved once; callers branch on is_ready() per request
+        self._ready = self.model is not None or (self.use_onnx and self.ort_session is not None)
+    
+    def is_ready(self) -> bool:
+        """Whether a PyTorch or ONNX model is loaded"""
+        return self._ready
     
     def _initialize_model(self):
         """Initialize reranker model"""
@@ -84,12 +91,20 @@ class Reranker:
             logger.error(f"Failed to load ONNX model: {e}")
             self.use_onnx = False
     
-    def rerank(self, query: str, passages: List[Dict], top_k: int = None) -> List[Dict]:
+    def rerank(
+        self,
+        query: str,
+        passages: List[Dict],
+        top_k: int = None,
+        batch_size: Optional[int] = None
+    ) -> List[Dict]:
         """Rerank passages based on relevance to query"""
         if top_k is None:
             top_k = config.TOPK_RERANK
+        if batch_size is None:
+            batch_size = config.RERANK_BATCH
         
-        if not self.model and not (self.use_onnx and hasattr(self, 'ort_session')):
+        if not self._ready:
             logger.warning("Reranker not available, returning original order")
             return passages[:top_k]
         
@@ -98,7 +113,7 @@ class Reranker:
         
         try:
             # Score each passage
-            scores = self._score_passages(query, passages)
+            scores = self._score_passages(query, passages, batch_size)
             
             # Add rerank scores to passages
             for passage, score in zip(passages, scores):
@@ -124,24 +139,29 @@ class Reranker:
             logger.error(f"Reranking failed: {e}")
             return passages[:top_k]
     
-    def _score_passages(self, query: str, passages: List[Dict]) -> List[float]:
+    def _score_passages(self, query: str, passages: List[Dict], batch_size: int) -> List[float]:
         """Score passages using the reranker model"""
         texts = [p.get("text", "") for p in passages]
         
-        if self.use_onnx and hasattr(self, 'ort_session'):
-            return self._score_with_onnx(query, texts)
+        if self.use_onnx and self.ort_session is not None:
+            return self._score_with_onnx(query, texts, batch_size)
         else:
-            return self._score_with_pytorch(query, texts)
+            return self._score_with_pytorch(query, texts, batch_size)
+    
+    @staticmethod
+    def _length_sorted_batches(passages: List[str], batch_size: int):
+        """Yield index batches of similar-length passages so each batch pads less"""
+        order = sorted(range(len(passages)), key=lambda i: len(passages[i]))
+        for start in range(0, len(order), max(1, batch_size)):
+            yield order[start:start + batch_size]
     
-    def _score_with_pytorch(self, query: str, passages: List[str]) -> List[float]:
+    def _score_with_pytorch(self, query: str, passages: List[str], batch_size: int) -> List[float]:
         """Score using PyTorch model"""
-        scores = []
-        
-        # Process in batches for efficiency
-        batch_size = 8
+        scores = [0.0] * len(passages)
+        use_fp16 = self.device == "cuda"
         
-        for i in range(0, len(passages), batch_size):
-            batch_passages = passages[i:i+batch_size]
+        for indices in self._length_sorted_batches(passages, batch_size):
+            batch_passages = [passages[i] for i in indices]
             
             # Tokenize
             inputs = self.tokenizer(
@@ -153,10 +173,11 @@ class Reranker:
                 return_tensors="pt"
             ).to(self.device)
             
-            # Get scores
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                logits = outputs.logits
+            # One forward pass per batch
+            with torch.inference_mode(), torch.autocast(
+                device_type="cuda", dtype=torch.float16, enabled=use_fp16
+            ):
+                logits = self.model(**inputs).logits.float()
                 
                 # Convert to probabilities
                 if logits.shape[-1] == 1:
@@ -166,19 +187,17 @@ class Reranker:
                     # Classification - use positive class probability
                     batch_scores = torch.softmax(logits, dim=-1)[:, 1].cpu().numpy()
             
-            scores.extend(batch_scores.tolist())
+            for i, score in zip(indices, batch_scores.tolist()):
+                scores[i] = score
         
         return scores
     
-    def _score_with_onnx(self, query: str, passages: List[str]) -> List[float]:
+    def _score_with_onnx(self, query: str, passages: List[str], batch_size: int) -> List[float]:
         """Score using ONNX model"""
-        scores = []
+        scores = [0.0] * len(passages)
         
-        # Process in batches
-        batch_size = 8
-        
-        for i in range(0, len(passages), batch_size):
-            batch_passages = passages[i:i+batch_size]
+        for indices in self._length_sorted_batches(passages, batch_size):
+            batch_passages = [passages[i] for i in indices]
             
             # Tokenize
             inputs = self.tokenizer(
@@ -212,6 +231,7 @@ class Reranker:
                 exp_logits = np.exp(logits - np.max(logits, axis=-1, keepdims=True))
                 batch_scores = exp_logits[:, 1] / np.sum(exp_logits, axis=-1)
             
-            scores.extend(batch_scores.tolist())
+            for i, score in zip(indices, batch_scores.tolist()):
+                scores[i] = score
         
-        return scores
\ No newline at end of file
+        return scores
@@ -128,13 +128,14 @@ class TopicChangeDetector:
         candidate_docs: List[str] = []
         overlap_ratio = 1.0
         if expanded_evidences:
-            overlap_ratio = self._overlap_ratio(previous_scope, analysis.expanded_doc_ids)
+            # expanded_doc_ids is already unique, so one pass gives both the new docs and the overlap
             new_docs = [doc_id for doc_id in analysis.expanded_doc_ids if doc_id not in previous_scope]
-            metrics["expanded_new_doc_ratio"] = (
-                float(len(new_docs)) / float(len(analysis.expanded_doc_ids))
-                if analysis.expanded_doc_ids
-                else 0.0
-            )
+            expanded_total = len(analysis.expanded_doc_ids)
+            if expanded_total:
+                overlap_ratio = (expanded_total - len(new_docs)) / expanded_total
+                metrics["expanded_new_doc_ratio"] = len(new_docs) / expanded_total
+            else:
+                metrics["expanded_new_doc_ratio"] = 0.0
             metrics["expanded_avg_delta"] = (
                 metrics["expanded_avg_score"] - metrics["primary_avg_score"]
             )
@@ -234,14 +235,6 @@ class TopicChangeDetector:
             score_f = score_f / 100.0
         return max(0.0, min(score_f, 1.0))
 
-    def _overlap_ratio(self, previous_scope: set, expanded_doc_ids: Sequence[str]) -> float:
-        if not expanded_doc_ids:
-            return 1.0
-        expanded_set = set(expanded_doc_ids)
-        if not expanded_set:
-            return 1.0
-        return len(previous_scope.intersection(expanded_set)) / len(expanded_set)
-
     def _sanitize_doc_ids(self, doc_ids: Sequence[str]) -> List[str]:
         if not doc_ids:
             return []
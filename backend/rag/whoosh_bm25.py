@@ -1,5 +1,6 @@
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
 from whoosh import index, qparser
@@ -121,8 +122,9 @@ class KiwiTokenizer(Tokenizer):
                     start_char += len(word) + 1
                 yield token
 
+@lru_cache(maxsize=1)
 def get_korean_analyzer():
-    """Create a Kiwi-based Korean analyzer with morphological analysis"""
+    """Create a Kiwi-based Korean analyzer with morphological analysis (shared)"""
     # Use Kiwi tokenizer for better Korean handling
     tokenizer = KiwiTokenizer()
 
@@ -142,6 +144,9 @@ def get_korean_analyzer():
 class WhooshBM25:
     """Whoosh-based BM25 search engine"""
     
+    # Schema shared by all instances (never mutated after creation)
+    _SCHEMA: Optional[Schema] = None
+    
     def __init__(self):
         self.index_dir = Path(config.WHOOSH_DIR)
         self.index_dir.mkdir(parents=True, exist_ok=True)
@@ -149,11 +154,26 @@ class WhooshBM25:
         self.schema = self._create_schema()
         self.integrity_checker = IndexIntegrityChecker(self.index_dir / "main")
         self._open_or_create_index()
-    
-    def _create_schema(self) -> Schema:
-        """Create index schema"""
-        analyzer = get_korean_analyzer()
         
+        # Query parser and scorer are reused across searches
+        # (MultifieldParser.parse builds a fresh query tree per call)
+        self._parser = qparser.MultifieldParser(
+            ["text", "doc_id"],
+            schema=self.schema,
+            group=qparser.OrGroup
+        )
+        self._weighting = BM25F()
+    
+    @classmethod
+    def _create_schema(cls) -> Schema:
+        """Get the index schema, creating it on first use"""
+        if cls._SCHEMA is None:
+            cls._SCHEMA = cls._build_schema(get_korean_analyzer())
+        return cls._SCHEMA
+    
+    @staticmethod
+    def _build_schema(analyzer) -> Schema:
+        """Build index schema with the given text analyzer"""
         return Schema(
             chunk_id=ID(stored=True, unique=True),
             doc_id=ID(stored=True),
@@ -234,19 +254,8 @@ class WhooshBM25:
                 logger.info("Removed corrupted index directory")
             
             index_path.mkdir(parents=True, exist_ok=True)
-            # Create schema and index
-            analyzer = get_korean_analyzer()
-            schema = Schema(
-                chunk_id=ID(stored=True, unique=True),
-                doc_id=ID(stored=True),
-                text=TEXT(stored=True, analyzer=analyzer, phrase=True),
-                page=NUMERIC(stored=True),
-                start_char=NUMERIC(stored=True),
-                end_char=NUMERIC(stored=True),
-                type=KEYWORD(stored=True),
-                section_or_page=NUMERIC(stored=True)
-            )
-            index.create_in(str(index_path), schema)
+            # Create index with the shared schema
+            index.create_in(str(index_path), cls._create_schema())
             logger.info(f"Initialized Whoosh index at {index_path}")
     
     def index_chunks(self, chunks: List[Dict]):
@@ -259,16 +268,20 @@ class WhooshBM25:
             writer = AsyncWriter(self.index)
             
             try:
+                # Bind the method once; chunker output always carries
+                # chunk_id/doc_id/text, only positional fields are optional
+                add = writer.add_document
                 for chunk in chunks:
-                    writer.add_document(
-                        chunk_id=chunk.get("chunk_id", ""),
-                        doc_id=chunk.get("doc_id", ""),
-                        text=chunk.get("text", ""),
-                        page=chunk.get("page", 0),
-                        start_char=chunk.get("start_char", 0),
-                        end_char=chunk.get("end_char", 0),
-                        type=chunk.get("type", "content"),
-                        section_or_page=chunk.get("section_or_page", 0)
+                    get = chunk.get
+                    add(
+                        chunk_id=chunk["chunk_id"],
+                        doc_id=chunk["doc_id"],
+                        text=chunk["text"],
+                        page=get("page", 0),
+                        start_char=get("start_char", 0),
+                        end_char=get("end_char", 0),
+                        type=get("type", "content"),
+                        section_or_page=get("section_or_page", 0)
                     )
                 
                 writer.commit()
@@ -279,6 +292,59 @@ class WhooshBM25:
                 logger.error(f"Failed to index chunks: {e}")
                 raise
     
+    def bulk_index_chunks(self, chunks: List[Dict], procs: Optional[int] = None):
+        """Index a large batch of chunks, optionally with parallel segment writers
+        
+        Intended for initial corpus loads and full reindexing; per-document
+        updates should keep using index_chunks(). procs defaults to
+        config.WHOOSH_BULK_PROCS; with one process, or if the multiprocess
+        writer fails, the chunks go through index_chunks().
+        """
+        if not chunks:
+            return
+        
+        if procs is None:
+            procs = config.WHOOSH_BULK_PROCS
+        if procs <= 1:
+            self.index_chunks(chunks)
+            return
+        
+        try:
+            self._write_multiprocess(chunks, procs)
+        except Exception as e:
+            # The multiprocess writer was cancelled, so nothing was committed
+            logger.warning(f"Multiprocess Whoosh write failed, retrying with a single writer: {e}")
+            self.index_chunks(chunks)
+    
+    def _write_multiprocess(self, chunks: List[Dict], procs: int):
+        """Write chunks with Whoosh's multiprocess writer in one commit"""
+        with safe_index_operation(self.integrity_checker):
+            # Each worker process writes its own segment; the final commit
+            # merges them together with the existing segments
+            writer = self.index.writer(procs=procs, multisegment=True)
+            
+            try:
+                add = writer.add_document
+                for chunk in chunks:
+                    get = chunk.get
+                    add(
+                        chunk_id=chunk["chunk_id"],
+                        doc_id=chunk["doc_id"],
+                        text=chunk["text"],
+                        page=get("page", 0),
+                        start_char=get("start_char", 0),
+                        end_char=get("end_char", 0),
+                        type=get("type", "content"),
+                        section_or_page=get("section_or_page", 0)
+                    )
+                
+                writer.commit(optimize=True)
+                logger.info(f"Bulk indexed {len(chunks)} chunks in Whoosh with {procs} processes")
+                
+            except Exception:
+                writer.cancel()
+                raise
+    
     def search(self, query: str, limit: int = None) -> List[Dict]:
         """Search using BM25 scoring"""
         if limit is None:
@@ -287,31 +353,26 @@ class WhooshBM25:
         results = []
         
         try:
-            with self.index.searcher(weighting=BM25F()) as searcher:
-                # Parse query
-                parser = qparser.MultifieldParser(
-                    ["text", "doc_id"],
-                    schema=self.schema,
-                    group=qparser.OrGroup
-                )
-                
+            with self.index.searcher(weighting=self._weighting) as searcher:
                 # Clean query for Whoosh
                 clean_query = self._clean_query(query)
-                parsed_query = parser.parse(clean_query)
+                parsed_query = self._parser.parse(clean_query)
                 
                 # Execute search
                 search_results = searcher.search(parsed_query, limit=limit)
                 
                 # Format results
                 for hit in search_results:
+                    # Decode stored fields once, then use plain dict lookups
+                    fields = hit.fields()
                     results.append({
-                        "chunk_id": hit["chunk_id"],
-                        "doc_id": hit["doc_id"],
-                        "text": hit["text"],
-                        "page": hit.get("page", 0),
-                        "start_char": hit.get("start_char", 0),
-                        "end_char": hit.get("end_char", 0),
-                        "type": hit.get("type", "content"),
+                        "chunk_id": fields["chunk_id"],
+                        "doc_id": fields["doc_id"],
+                        "text": fields["text"],
+                        "page": fields.get("page", 0),
+                        "start_char": fields.get("start_char", 0),
+                        "end_char": fields.get("end_char", 0),
+                        "type": fields.get("type", "content"),
                         "score": hit.score
                     })
                 
@@ -343,29 +404,28 @@ class WhooshBM25:
     
     def delete_document(self, doc_id: str) -> int:
         """Delete all chunks for a document"""
-        count = 0
         try:
-            # First count how many will be deleted
-            with self.index.searcher() as searcher:
-                from whoosh.query import Term
-                query = Term("doc_id", doc_id)
-                results = searcher.search(query, limit=None)
-                count = len(results)
-            
-            if count > 0:
-                # Now delete using a writer
-                writer = self.index.writer()
-                try:
-                    # Delete all documents with this doc_id
-                    writer.delete_by_term("doc_id", doc_id)
-                    writer.commit()
-                    logger.info(f"Deleted {count} chunks for document: {doc_id}")
-                except Exception as e:
-                    logger.error(f"Failed to delete document {doc_id}: {e}")
+            writer = self.index.writer()
+            try:
+                # Collect matching doc numbers without scoring, using the
+                # writer's own reader so the numbers stay valid for deletion
+                with writer.searcher() as searcher:
+                    docnums = list(searcher.document_numbers(doc_id=doc_id))
+
+                if not docnums:
                     writer.cancel()
                     return 0
-            
-            return count
+
+                for docnum in docnums:
+                    writer.delete_document(docnum)
+                writer.commit(merge=False)
+                logger.info(f"Deleted {len(docnums)} chunks for document: {doc_id}")
+            except Exception as e:
+                logger.error(f"Failed to delete document {doc_id}: {e}")
+                writer.cancel()
+                return 0
+
+            return len(docnums)
         except Exception as e:
             logger.error(f"Failed to delete document {doc_id}: {e}")
             return 0
@@ -374,11 +434,9 @@ class WhooshBM25:
         """Update a chunk in the index"""
         writer = self.index.writer()
         try:
-            # Delete old version
-            writer.delete_by_term("chunk_id", chunk["chunk_id"])
-            
-            # Add new version
-            writer.add_document(
+            # chunk_id is the unique field, so update_document replaces
+            # any existing version in one operation
+            writer.update_document(
                 chunk_id=chunk.get("chunk_id", ""),
                 doc_id=chunk.get("doc_id", ""),
                 text=chunk.get("text", ""),
@@ -1,16 +1,65 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Dict, List, Optional
+from fastapi import APIRouter, HTTPException, Depends, Header, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse, PlainTextResponse, StreamingResponse
+from typing import Dict, List, Optional, Tuple
 import asyncio
 import logging
 from pathlib import Path
+from functools import lru_cache
+from datetime import datetime, timedelta
 import json
+import time
+
+import numpy as np
+import psutil
 
 from config import config
 from eval.golden_evaluator import GoldenEvaluator
+from utils.cache import clear_all_caches
+from utils.query_logger import LogColumns, get_query_logger
+from utils.tail import open_tail, stream_tail
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Process handle reused across metric scrapes
+_PROCESS = psutil.Process()
+
+# Prime the non-blocking CPU counters; subsequent interval=None calls
+# report usage since the previous call instead of sleeping
+psutil.cpu_percent(interval=None)
+_PROCESS.cpu_percent(interval=None)
+
+# Latest system metrics sample, refreshed by run_metrics_sampler()
+_METRICS_SAMPLE_INTERVAL_S = 2.0
+_last_metrics: Dict = {}
+
+# Configuration keys that may be changed at runtime and their value types
+_CONFIG_TYPES = {
+    "CHUNK_TOKENS": int,
+    "CHUNK_OVERLAP": int,
+    "W_BM25": float,
+    "W_VECTOR": float,
+    "W_RERANK": float,
+    "TOPK_BM25": int,
+    "TOPK_VECTOR": int,
+    "TOPK_RERANK": int,
+    "GEN_TEMPERATURE": float,
+    "GEN_TOP_P": float,
+    "GEN_MAX_TOKENS": int,
+    "EVIDENCE_JACCARD": float,
+    "CITATION_SENT_SIM": float,
+    "CONFIDENCE_MIN": float
+}
+_VALID_CONFIG_KEYS = frozenset(_CONFIG_TYPES)
+
+# The evaluator keeps per-run state, so runs are serialized
+_evaluation_lock = asyncio.Lock()
+
+@lru_cache(maxsize=1)
+def _get_evaluator() -> GoldenEvaluator:
+    """Get the shared golden evaluator"""
+    return GoldenEvaluator()
 
 @router.get("/config")
 async def get_configuration() -> Dict:
@@ -50,30 +99,31 @@ async def get_configuration() -> Dict:
 async def update_configuration(updates: Dict) -> Dict:
     """Update system configuration (requires restart)"""
     
-    # Validate updates
-    valid_keys = {
-        "CHUNK_TOKENS", "CHUNK_OVERLAP", "W_BM25", "W_VECTOR", 
-        "W_RERANK", "TOPK_BM25", "TOPK_VECTOR", "TOPK_RERANK",
-        "GEN_TEMPERATURE", "GEN_TOP_P", "GEN_MAX_TOKENS",
-        "EVIDENCE_JACCARD", "CITATION_SENT_SIM", "CONFIDENCE_MIN"
-    }
-    
-    for key in updates:
-        if key not in valid_keys:
+    # Validate and coerce every value before applying any of them
+    coerced = {}
+    for key, value in updates.items():
+        if key not in _VALID_CONFIG_KEYS:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid configuration key: {key}"
             )
+        try:
+            coerced[key] = _CONFIG_TYPES[key](value)
+        except (TypeError, ValueError):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid value for {key}: {value!r}"
+            )
     
     # Update config
-    for key, value in updates.items():
+    for key, value in coerced.items():
         setattr(config, key, value)
     
-    logger.info(f"Configuration updated: {updates}")
+    logger.info(f"Configuration updated: {coerced}")
     
     return {
         "status": "updated",
-        "updates": updates,
+        "updates": coerced,
         "message": "Configuration updated. Some changes may require restart."
     }
 
@@ -90,8 +140,9 @@ async def run_evaluation() -> Dict:
         )
     
     try:
-        evaluator = GoldenEvaluator()
-        results = await evaluator.evaluate_all()
+        evaluator = await asyncio.to_thread(_get_evaluator)
+        async with _evaluation_lock:
+            results = await evaluator.evaluate_all()
         
         return results
         
@@ -100,41 +151,39 @@ async def run_evaluation() -> Dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/logs")
-async def get_recent_logs(lines: int = 100) -> List[str]:
-    """Get recent log entries"""
+async def get_recent_logs(lines: int = 100) -> StreamingResponse:
+    """Get recent log entries as plain text"""
     
     log_file = Path("logs/app.log")
     
     if not log_file.exists():
-        return []
+        return PlainTextResponse("")
     
     try:
-        with open(log_file, "r") as f:
-            all_lines = f.readlines()
-            return all_lines[-lines:]
+        fd, offset, size = await asyncio.to_thread(open_tail, log_file, lines)
     except Exception as e:
         logger.error(f"Failed to read logs: {e}")
-        return [f"Error reading logs: {e}"]
-
-@router.get("/metrics")
-async def get_system_metrics() -> Dict:
-    """Get system performance metrics"""
+        return PlainTextResponse(f"Error reading logs: {e}\n")
     
-    import psutil
-    import time
+    return StreamingResponse(
+        stream_tail(fd, offset, size),
+        media_type="text/plain; charset=utf-8"
+    )
+
+def _collect_system_metrics() -> Dict:
+    """Sample system and process metrics (blocking syscalls)"""
     
     # Get system metrics
-    cpu_percent = psutil.cpu_percent(interval=1)
+    cpu_percent = psutil.cpu_percent(interval=None)
     memory = psutil.virtual_memory()
     disk = psutil.disk_usage('/')
     
     # Get process metrics
-    process = psutil.Process()
     process_info = {
-        "cpu_percent": process.cpu_percent(),
-        "memory_mb": process.memory_info().rss / 1024 / 1024,
-        "threads": process.num_threads(),
-        "open_files": len(process.open_files())
+        "cpu_percent": _PROCESS.cpu_percent(interval=None),
+        "memory_mb": _PROCESS.memory_info().rss / 1024 / 1024,
+        "threads": _PROCESS.num_threads(),
+        "open_files": len(_PROCESS.open_files())
     }
     
     return {
@@ -149,15 +198,36 @@ async def get_system_metrics() -> Dict:
         "timestamp": time.time()
     }
 
+async def run_metrics_sampler():
+    """Refresh the shared metrics sample periodically until cancelled"""
+    while True:
+        try:
+            sample = await asyncio.to_thread(_collect_system_metrics)
+            _last_metrics.clear()
+            _last_metrics.update(sample)
+        except Exception as e:
+            logger.warning(f"Failed to sample system metrics: {e}")
+        
+        await asyncio.sleep(_METRICS_SAMPLE_INTERVAL_S)
+
+@router.get("/metrics")
+async def get_system_metrics() -> Dict:
+    """Get system performance metrics"""
+    
+    if not _last_metrics:
+        # Sampler not started yet (e.g. router mounted without app lifespan)
+        return await asyncio.to_thread(_collect_system_metrics)
+    
+    return {**_last_metrics, "timestamp": time.time()}
+
 @router.post("/cache/clear")
 async def clear_caches() -> Dict:
     """Clear all caches"""
     
     # Clear various caches
-    from utils.cache import clear_all_caches
     
     try:
-        cleared = clear_all_caches()
+        cleared = await asyncio.to_thread(clear_all_caches)
         
         return {
             "status": "cleared",
@@ -182,15 +252,66 @@ async def get_active_sessions() -> Dict:
 # Enhanced Log Analysis Endpoints
 # ============================================================================
 
+def _log_dir_stamp(query_logger, date: str) -> Tuple[int, int]:
+    """Get a stamp of a date's query logs; changes on every new or updated log"""
+    return query_logger.logs_stamp(date)
+
+@lru_cache(maxsize=64)
+def _cached_statistics(date: str, stamp: Tuple[int, int]) -> Dict:
+    """Compute statistics for a date; the stamp only serves as cache key"""
+    return get_query_logger().get_statistics(date)
+
+# Last statistics computed for today: {date: (stamp, stats)}
+_today_statistics: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+_today_refresh: Dict[str, asyncio.Task] = {}
+
+async def _refresh_today_statistics(date: str, stamp: Tuple[int, int]) -> Dict:
+    """Recompute today's statistics and remember them as the latest"""
+    stats = await asyncio.to_thread(_cached_statistics, date, stamp)
+    _today_statistics.clear()
+    _today_statistics[date] = (stamp, stats)
+    return stats
+
+async def _get_statistics(
+    date: Optional[str] = None,
+    stamp: Optional[Tuple[int, int]] = None
+) -> Dict:
+    """Get statistics for a date, reusing results until its logs change
+    
+    Past days are served from the stamp-keyed cache. While today's logs
+    change, the previous result is returned with status "loading" and a
+    refresh runs in the background. Callers that already hold the date's
+    stamp pass it to skip another directory scan.
+    """
+
+    query_logger = get_query_logger()
+    today = datetime.now().strftime("%Y-%m-%d")
+    if date is None:
+        date = today
+    if stamp is None:
+        stamp = await asyncio.to_thread(_log_dir_stamp, query_logger, date)
+
+    if date != today:
+        return await asyncio.to_thread(_cached_statistics, date, stamp)
+
+    latest = _today_statistics.get(date)
+    if latest is None:
+        return await _refresh_today_statistics(date, stamp)
+    if latest[0] == stamp:
+        return latest[1]
+
+    task = _today_refresh.get(date)
+    if task is None or task.done():
+        _today_refresh.clear()
+        _today_refresh[date] = asyncio.create_task(_refresh_today_statistics(date, stamp))
+    return {**latest[1], "status": "loading"}
+
 @router.get("/logs/statistics")
 async def get_log_statistics(date: Optional[str] = None) -> Dict:
     """Get comprehensive log statistics for a specific date"""
-    from utils.query_logger import get_query_logger
 
     try:
-        query_logger = get_query_logger()
-        stats = query_logger.get_statistics(date)
-        return stats
+        return await _get_statistics(date)
     except Exception as e:
         logger.error(f"Failed to get statistics: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -204,11 +325,11 @@ async def search_logs(
     limit: int = 50
 ) -> List[Dict]:
     """Search logs with various filters"""
-    from utils.query_logger import get_query_logger
 
     try:
         query_logger = get_query_logger()
-        logs = query_logger.search_logs(
+        logs = await asyncio.to_thread(
+            query_logger.search_logs,
             query_text=query_text,
             date=date,
             min_confidence=min_confidence,
@@ -223,92 +344,174 @@ async def search_logs(
 @router.get("/logs/recent")
 async def get_recent_queries(limit: int = 20, date: Optional[str] = None) -> List[Dict]:
     """Get recent query logs"""
-    from utils.query_logger import get_query_logger
 
     try:
         query_logger = get_query_logger()
-        logs = query_logger.load_logs(date=date, limit=limit)
+        logs = await asyncio.to_thread(query_logger.load_logs, date=date, limit=limit)
         return logs
     except Exception as e:
         logger.error(f"Failed to load recent logs: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@lru_cache(maxsize=32)
+def _render_report(date: str, stamp: Tuple[int, int]) -> str:
+    """Generate the HTML report for a date and read it back; the stamp only serves as cache key"""
+
+    report_path = get_query_logger().generate_report(date)
+    with open(report_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _report_stamp(date: str) -> Tuple[int, int]:
+    """Get the cache stamp of a date's logs"""
+    return _log_dir_stamp(get_query_logger(), date)
+
 @router.get("/logs/report")
-async def generate_log_report(date: Optional[str] = None):
+async def generate_log_report(
+    date: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None)
+):
     """Generate HTML report for query logs"""
-    from utils.query_logger import get_query_logger
 
     try:
-        query_logger = get_query_logger()
-        report_path = query_logger.generate_report(date)
+        if date is None:
+            date = datetime.now().strftime("%Y-%m-%d")
+
+        stamp = await asyncio.to_thread(_report_stamp, date)
+        etag = f'"{date}-{stamp[0]}-{stamp[1]}"'
+        if if_none_match == etag:
+            return Response(status_code=304, headers={"ETag": etag})
 
-        # Read and return HTML
-        with open(report_path, 'r', encoding='utf-8') as f:
-            html_content = f.read()
+        html_content = await asyncio.to_thread(_render_report, date, stamp)
 
-        from fastapi.responses import HTMLResponse
-        return HTMLResponse(content=html_content)
+        return HTMLResponse(content=html_content, headers={"ETag": etag})
     except Exception as e:
         logger.error(f"Failed to generate report: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@lru_cache(maxsize=4)
+def _cached_log_columns(date: str, stamp: Tuple[int, int]) -> LogColumns:
+    """Load all logs for a date as columns; the stamp only serves as cache key"""
+    return get_query_logger().load_logs_columnar(date)
+
+def _load_log_columns(date: Optional[str] = None) -> LogColumns:
+    """Load a date's logs as columns, shared across endpoints until the logs change"""
+
+    query_logger = get_query_logger()
+    if date is None:
+        date = datetime.now().strftime("%Y-%m-%d")
+    return _cached_log_columns(date, _log_dir_stamp(query_logger, date))
+
+def _quality_summary(cols: LogColumns, limit: int) -> Dict:
+    """Find quality issues with column masks, materializing only returned rows"""
+    records = cols.records
+
+    low_confidence = np.flatnonzero(cols.confidence < 0.3)
+    hallucinations = np.flatnonzero(cols.hallucination)
+    generic_responses = np.flatnonzero(cols.generic)
+    no_sources = np.flatnonzero((cols.source_count == 0) & cols.is_normal)
+
+    return {
+        'low_confidence': [
+            {
+                'query': records[i].get('query'),
+                'timestamp': records[i].get('timestamp'),
+                'confidence': records[i].get('quality_metrics', {}).get('confidence_score', 0)
+            }
+            for i in low_confidence[:limit]
+        ],
+        'hallucinations': [
+            {
+                'query': records[i].get('query'),
+                'timestamp': records[i].get('timestamp'),
+                'response': records[i].get('model_response', '')[:200]
+            }
+            for i in hallucinations[:limit]
+        ],
+        'generic_responses': [
+            {
+                'query': records[i].get('query'),
+                'timestamp': records[i].get('timestamp'),
+                'response': records[i].get('model_response', '')[:200]
+            }
+            for i in generic_responses[:limit]
+        ],
+        'no_sources': [
+            {
+                'query': records[i].get('query'),
+                'timestamp': records[i].get('timestamp')
+            }
+            for i in no_sources[:limit]
+        ],
+        'counts': {
+            'low_confidence': len(low_confidence),
+            'hallucinations': len(hallucinations),
+            'generic_responses': len(generic_responses),
+            'no_sources': len(no_sources)
+        }
+    }
+
+def _top_indices(values: np.ndarray, mask: np.ndarray, k: int = 20) -> np.ndarray:
+    """Indices of the k largest masked values, descending, earlier records first on ties"""
+    idx = np.flatnonzero(mask)
+    vals = values[idx]
+    if len(idx) > k:
+        # Keep only candidates at or above the k-th largest value before sorting
+        kth = np.partition(vals, -k)[-k]
+        keep = vals >= kth
+        idx, vals = idx[keep], vals[keep]
+    return idx[np.argsort(-vals, kind='stable')][:k]
+
+def _performance_summary(cols: LogColumns, slow_threshold_ms: int = 5000) -> Dict:
+    """Find performance issues with column masks, materializing only returned rows"""
+    records = cols.records
+
+    slow_mask = cols.total_time_ms > slow_threshold_ms
+    mem_mask = cols.memory_mb > 500
+    tok_mask = cols.total_tokens > 2000
+
+    slow_queries = []
+    for i in _top_indices(cols.total_time_ms, slow_mask):
+        perf = records[i].get('performance_metrics', {})
+        slow_queries.append({
+            'query': records[i].get('query'),
+            'timestamp': records[i].get('timestamp'),
+            'total_time_ms': perf.get('total_time_ms', 0),
+            'search_time_ms': perf.get('search_time_ms', 0),
+            'generation_time_ms': perf.get('generation_time_ms', 0)
+        })
+
+    return {
+        'slow_queries': slow_queries,
+        'high_memory': [
+            {
+                'query': records[i].get('query'),
+                'timestamp': records[i].get('timestamp'),
+                'memory_mb': records[i].get('performance_metrics', {}).get('memory_used_mb', 0)
+            }
+            for i in _top_indices(cols.memory_mb, mem_mask)
+        ],
+        'high_tokens': [
+            {
+                'query': records[i].get('query'),
+                'timestamp': records[i].get('timestamp'),
+                'tokens': records[i].get('performance_metrics', {}).get('total_tokens', 0)
+            }
+            for i in _top_indices(cols.total_tokens, tok_mask)
+        ],
+        'counts': {
+            'slow_queries': int(slow_mask.sum()),
+            'high_memory': int(mem_mask.sum()),
+            'high_tokens': int(tok_mask.sum())
+        }
+    }
+
 @router.get("/logs/quality-issues")
 async def get_quality_issues(date: Optional[str] = None, limit: int = 20) -> Dict:
     """Get queries with quality issues"""
-    from utils.query_logger import get_query_logger
 
     try:
-        query_logger = get_query_logger()
-        logs = query_logger.load_logs(date=date)
-
-        # Filter for quality issues
-        low_confidence = []
-        hallucinations = []
-        generic_responses = []
-        no_sources = []
-
-        for log in logs:
-            qual = log.get('quality_metrics', {})
-
-            if qual.get('confidence_score', 0) < 0.3:
-                low_confidence.append({
-                    'query': log.get('query'),
-                    'timestamp': log.get('timestamp'),
-                    'confidence': qual.get('confidence_score', 0)
-                })
-
-            if qual.get('hallucination_detected'):
-                hallucinations.append({
-                    'query': log.get('query'),
-                    'timestamp': log.get('timestamp'),
-                    'response': log.get('model_response', '')[:200]
-                })
-
-            if qual.get('generic_response'):
-                generic_responses.append({
-                    'query': log.get('query'),
-                    'timestamp': log.get('timestamp'),
-                    'response': log.get('model_response', '')[:200]
-                })
-
-            if qual.get('source_count', 0) == 0 and log.get('query_type') == 'normal':
-                no_sources.append({
-                    'query': log.get('query'),
-                    'timestamp': log.get('timestamp')
-                })
-
-        return {
-            'low_confidence': low_confidence[:limit],
-            'hallucinations': hallucinations[:limit],
-            'generic_responses': generic_responses[:limit],
-            'no_sources': no_sources[:limit],
-            'counts': {
-                'low_confidence': len(low_confidence),
-                'hallucinations': len(hallucinations),
-                'generic_responses': len(generic_responses),
-                'no_sources': len(no_sources)
-            }
-        }
+        cols = await asyncio.to_thread(_load_log_columns, date)
+        return _quality_summary(cols, limit)
     except Exception as e:
         logger.error(f"Failed to get quality issues: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -316,79 +519,95 @@ async def get_quality_issues(date: Optional[str] = None, limit: int = 20) -> Dic
 @router.get("/logs/performance-issues")
 async def get_performance_issues(date: Optional[str] = None, slow_threshold_ms: int = 5000) -> Dict:
     """Get queries with performance issues"""
-    from utils.query_logger import get_query_logger
 
     try:
-        query_logger = get_query_logger()
-        logs = query_logger.load_logs(date=date)
-
-        slow_queries = []
-        high_memory = []
-        high_tokens = []
-
-        for log in logs:
-            perf = log.get('performance_metrics', {})
-
-            if perf.get('total_time_ms', 0) > slow_threshold_ms:
-                slow_queries.append({
-                    'query': log.get('query'),
-                    'timestamp': log.get('timestamp'),
-                    'total_time_ms': perf.get('total_time_ms', 0),
-                    'search_time_ms': perf.get('search_time_ms', 0),
-                    'generation_time_ms': perf.get('generation_time_ms', 0)
-                })
-
-            if perf.get('memory_used_mb', 0) > 500:
-                high_memory.append({
-                    'query': log.get('query'),
-                    'timestamp': log.get('timestamp'),
-                    'memory_mb': perf.get('memory_used_mb', 0)
-                })
-
-            if perf.get('total_tokens', 0) > 2000:
-                high_tokens.append({
-                    'query': log.get('query'),
-                    'timestamp': log.get('timestamp'),
-                    'tokens': perf.get('total_tokens', 0)
-                })
+        cols = await asyncio.to_thread(_load_log_columns, date)
+        return _performance_summary(cols, slow_threshold_ms)
+    except Exception as e:
+        logger.error(f"Failed to get performance issues: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/logs/issues")
+async def get_log_issues(
+    date: Optional[str] = None,
+    limit: int = 20,
+    slow_threshold_ms: int = 5000
+) -> Dict:
+    """Get quality and performance issues from a single log load"""
 
+    try:
+        cols = await asyncio.to_thread(_load_log_columns, date)
         return {
-            'slow_queries': sorted(slow_queries, key=lambda x: x['total_time_ms'], reverse=True)[:20],
-            'high_memory': sorted(high_memory, key=lambda x: x['memory_mb'], reverse=True)[:20],
-            'high_tokens': sorted(high_tokens, key=lambda x: x['tokens'], reverse=True)[:20],
-            'counts': {
-                'slow_queries': len(slow_queries),
-                'high_memory': len(high_memory),
-                'high_tokens': len(high_tokens)
-            }
+            'quality': _quality_summary(cols, limit),
+            'performance': _performance_summary(cols, slow_threshold_ms)
         }
     except Exception as e:
-        logger.error(f"Failed to get performance issues: {e}")
+        logger.error(f"Failed to get log issues: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Maximum number of days computed concurrently for trends
+_TRENDS_CONCURRENCY = 8
+
+# Trend entries for the days before today, per requested range:
+# {days: (today, past day stamps, entries newest first)}
+_trends_cache: Dict[int, Tuple[str, List[Tuple[int, int]], List[Optional[Dict]]]] = {}
+_TRENDS_CACHE_SIZE = 8
+
+def _trend_entry(date: str, stats: Dict) -> Optional[Dict]:
+    """Reduce a day's statistics to a trend point, None if the day has no logs"""
+    if 'error' in stats:
+        return None
+    return {
+        'date': date,
+        'total_queries': stats.get('total_queries', 0),
+        'avg_confidence': stats.get('quality', {}).get('avg_confidence', 0),
+        'avg_response_time_ms': stats.get('performance', {}).get('avg_total_time_ms', 0),
+        'error_rate': stats.get('errors', {}).get('error_rate', 0),
+        'hallucination_rate': stats.get('quality', {}).get('hallucination_rate', 0)
+    }
+
+def _log_dir_stamps(dates: List[str]) -> List[Tuple[int, int]]:
+    """Get the log directory stamps of several dates"""
+    query_logger = get_query_logger()
+    return [_log_dir_stamp(query_logger, date) for date in dates]
+
 @router.get("/logs/trends")
 async def get_log_trends(days: int = 7) -> Dict:
     """Get multi-day trends"""
-    from utils.query_logger import get_query_logger
-    from datetime import datetime, timedelta
 
     try:
-        query_logger = get_query_logger()
-        trends = []
-
-        for i in range(days):
-            date = (datetime.now() - timedelta(days=i)).strftime("%Y-%m-%d")
-            stats = query_logger.get_statistics(date)
-
-            if 'error' not in stats:
-                trends.append({
-                    'date': date,
-                    'total_queries': stats.get('total_queries', 0),
-                    'avg_confidence': stats.get('quality', {}).get('avg_confidence', 0),
-                    'avg_response_time_ms': stats.get('performance', {}).get('avg_total_time_ms', 0),
-                    'error_rate': stats.get('errors', {}).get('error_rate', 0),
-                    'hallucination_rate': stats.get('quality', {}).get('hallucination_rate', 0)
-                })
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
+        past_dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(1, days)]
+
+        # Days are independent; bound concurrency so large ranges don't
+        # exhaust worker threads or file descriptors
+        semaphore = asyncio.Semaphore(_TRENDS_CONCURRENCY)
+
+        async def day_entry(date: str, stamp: Optional[Tuple[int, int]] = None) -> Optional[Dict]:
+            async with semaphore:
+                return _trend_entry(date, await _get_statistics(date, stamp))
+
+        # Past days rarely change, so their entries are reused until the
+        # date rolls over or one of their log directories changes
+        stamps = await asyncio.to_thread(_log_dir_stamps, past_dates)
+        cached = _trends_cache.get(days)
+        if cached is not None and cached[0] == today and cached[1] == stamps:
+            past_entries = cached[2]
+        else:
+            past_entries = await asyncio.gather(*(
+                day_entry(date, stamp) for date, stamp in zip(past_dates, stamps)
+            ))
+
+            if len(_trends_cache) >= _TRENDS_CACHE_SIZE or any(
+                entry[0] != today for entry in _trends_cache.values()
+            ):
+                _trends_cache.clear()
+            _trends_cache[days] = (today, stamps, past_entries)
+
+        today_entry = await day_entry(today) if days > 0 else None
+
+        trends = [entry for entry in [today_entry, *past_entries] if entry is not None]
 
         return {
             'trends': list(reversed(trends)),
@@ -396,4 +615,4 @@ async def get_log_trends(days: int = 7) -> Dict:
         }
     except Exception as e:
         logger.error(f"Failed to get trends: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
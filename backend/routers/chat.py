@@ -1,16 +1,19 @@
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect, Depends, Query, Request
-from fastapi.responses import StreamingResponse
-from typing import Dict, List, Optional, Any, Tuple
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Any, Tuple
 import asyncio
-import json
 import logging
 from datetime import datetime
 from starlette.requests import ClientDisconnect
 import re
+import weakref
+
+import orjson
 
 from schemas import QueryRequest, QueryResponse
 from models.session import ChatSession, Message
 from services.session_manager import session_manager
+from services.semantic_cache import semantic_cache
 from rag.evidence_enforcer import EvidenceEnforcer
 from rag.citation_tracker import CitationTracker
 from rag.answer_formatter import AnswerFormatter
@@ -32,12 +35,21 @@ from utils.error_handler import ErrorHandler
 from utils.rate_limiter import RateLimiter
 from services.title_generator import TitleGenerator
 from utils.query_logger import get_query_logger, QueryLog, SearchResult
+from utils.text import nfc_doc_id
 import time
 
 logger = logging.getLogger(__name__)
 query_logger = get_query_logger()
 
-router = APIRouter()
+# Reasoning sections some models emit before the answer
+_THINK_RE = re.compile(
+    r"<think>.*?</think>|<thinking>.*?</thinking>|\[think\].*?\[/think\]",
+    re.DOTALL | re.IGNORECASE
+)
+_THINK_STRAY_RE = re.compile(r"</?think(?:ing)?>|\[/?think\]", re.IGNORECASE)
+_CITATION_RE = re.compile(r"\[(\d+)\]")
+
+router = APIRouter(default_response_class=ORJSONResponse)
 
 # Component initialization (lazy to make testing lightweight)
 retriever: Optional[Any] = None
@@ -128,6 +140,87 @@ def get_response_validator() -> ResponseValidator:
     return response_validator
 
 
+def _strip_think_sections(text: str) -> str:
+    """Remove reasoning sections and stray think tags from generated text"""
+    if not isinstance(text, str) or not text:
+        return text
+    text = _THINK_RE.sub('', text)
+    text = _THINK_STRAY_RE.sub('', text)
+    return text.strip()
+
+
+class _ThinkTagFilter:
+    """Incrementally drop think sections from streamed text
+
+    Each chunk is searched from where the previous scan stopped, and only
+    a possible partial tag is held back between chunks.
+    """
+
+    _START_RE = re.compile(r"<think>|<thinking>|\[think\]", re.IGNORECASE)
+    _END_RE = re.compile(r"</think>|</thinking>|\[/think\]", re.IGNORECASE)
+    # Longest tag minus one: the most a split tag can leave at the end
+    _HOLD = len("</thinking>") - 1
+
+    def __init__(self):
+        self.in_think = False
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk and return the text that is safe to emit"""
+        # Most tokens carry no tag characters: pass them through untouched
+        if not self.in_think and not self._pending and "<" not in chunk and "[" not in chunk:
+            return chunk
+        text = self._pending + chunk if self._pending else chunk
+        emitted: List[str] = []
+        pos = 0
+
+        while True:
+            if not self.in_think:
+                match = self._START_RE.search(text, pos)
+                if match:
+                    emitted.append(text[pos:match.start()])
+                    pos = match.end()
+                    self.in_think = True
+                    continue
+                # Hold back a trailing '<' or '[' that may start a tag
+                hold_from = max(pos, len(text) - self._HOLD)
+                cut = max(text.rfind("<", hold_from), text.rfind("[", hold_from))
+                if cut == -1:
+                    cut = len(text)
+                emitted.append(text[pos:cut])
+                self._pending = text[cut:]
+                break
+
+            match = self._END_RE.search(text, pos)
+            if match:
+                pos = match.end()
+                self.in_think = False
+                continue
+            # Think content is discarded; keep only a possible partial end tag
+            self._pending = text[max(pos, len(text) - self._HOLD):]
+            break
+
+        return "".join(emitted)
+
+    def flush(self) -> str:
+        """Return held-back text once the stream has ended"""
+        remaining, self._pending = self._pending, ""
+        return "" if self.in_think else remaining
+
+
+_NDJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _ndjson(payload: Dict[str, Any]) -> bytes:
+    """Encode one NDJSON frame of the streaming response"""
+    return orjson.dumps(payload, option=_NDJSON_OPTIONS) + b"\n"
+
+
+def _ndjson_content(text: str) -> bytes:
+    """Encode a content frame without building a dict per token chunk"""
+    return b'{"content":' + orjson.dumps(text) + b'}\n'
+
+
 def _deduplicate_doc_ids(doc_ids: Optional[List[str]]) -> List[str]:
     if not doc_ids:
         return []
@@ -142,7 +235,7 @@ def _deduplicate_doc_ids(doc_ids: Optional[List[str]]) -> List[str]:
 
 
 def _extract_unique_doc_ids(evidences: List[Dict[str, Any]]) -> List[str]:
-    return _deduplicate_doc_ids([e.get("doc_id") for e in evidences])
+    return list(dict.fromkeys(doc_id for e in evidences if (doc_id := e.get("doc_id"))))
 
 
 def _average_evidence_score(evidences: List[Dict[str, Any]]) -> Optional[float]:
@@ -161,12 +254,20 @@ def _average_evidence_score(evidences: List[Dict[str, Any]]) -> Optional[float]:
     return sum(scores) / len(scores)
 
 
+def _iter_memory_lines(response: Dict) -> Iterator[str]:
+    """Yield answer lines, key facts, then detail lines without building a list"""
+    if response.get("answer"):
+        yield from response["answer"].splitlines()
+    yield from response.get("key_facts", []) or []
+    if response.get("details"):
+        yield from response["details"].splitlines()
+
+
 def _collect_memory_facts(response: Dict) -> List[Dict[str, str]]:
     """Extract memory snippets from formatted response by citation index."""
     if not response:
         return []
 
-    pattern = re.compile(r'\[(\d+)\]')
     sources = response.get("sources", []) or []
 
     number_to_doc: Dict[int, Optional[str]] = {}
@@ -176,27 +277,17 @@ def _collect_memory_facts(response: Dict) -> List[Dict[str, str]]:
         if doc_id:
             number_to_doc[int(display)] = doc_id
 
-    texts: List[str] = []
-    if response.get("answer"):
-        texts.extend(response["answer"].split('\n'))
-    for fact in response.get("key_facts", []) or []:
-        texts.append(fact)
-    if response.get("details"):
-        texts.extend(response["details"].split('\n'))
-
     memory: List[Dict[str, str]] = []
     seen: set = set()
 
-    for line in texts:
+    for line in _iter_memory_lines(response):
         stripped = line.strip()
         if not stripped:
             continue
-        doc_ids = {
-            number_to_doc.get(int(num))
-            for num in pattern.findall(stripped)
-            if number_to_doc.get(int(num))
-        }
-        for doc_id in doc_ids:
+        for match in _CITATION_RE.finditer(stripped):
+            doc_id = number_to_doc.get(int(match.group(1)))
+            if not doc_id:
+                continue
             key = (doc_id, stripped)
             if key in seen:
                 continue
@@ -289,34 +380,184 @@ def _resolve_evidences(
     )
 
 
+def _embed_for_cache(retriever_instance, text: str) -> Optional[Any]:
+    """Embed a retrieval query for the semantic cache, None when unavailable"""
+    if not config.SEMANTIC_CACHE_ENABLED:
+        return None
+    embed_query = getattr(retriever_instance, "embed_query", None)
+    if embed_query is None:
+        return None
+    try:
+        return embed_query(text)
+    except Exception as e:
+        logger.debug(f"Semantic cache embedding failed: {e}")
+        return None
+
+
+def _semantic_cache_entry(
+    response: Dict[str, Any],
+    assistant_content: str,
+    metadata: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Snapshot of a finished answer that can be replayed for a similar query"""
+    return {
+        "answer": response.get("answer", ""),
+        "key_facts": response.get("key_facts", []),
+        "details": response.get("details", ""),
+        "sources": response.get("sources", []),
+        "formatted_text": response.get("formatted_text", ""),
+        "formatted_html": response.get("formatted_html", ""),
+        "formatted_markdown": response.get("formatted_markdown", ""),
+        "confidence": response.get("verification", {}).get("confidence", 0),
+        "content": assistant_content,
+        "metadata": dict(metadata),
+    }
+
+
+def _semantic_cache_metadata(entry: Dict[str, Any], similarity: float) -> Dict[str, Any]:
+    return {
+        **entry["metadata"],
+        "title_updated": False,
+        "new_title": None,
+        "semantic_cache": {"hit": True, "similarity": similarity},
+    }
+
+
+async def _log_semantic_cache_hit(
+    session_id: str,
+    query: str,
+    entry: Dict[str, Any],
+    similarity: float
+):
+    """Log a replayed answer so cache hits still count in the query statistics"""
+    try:
+        replayed = {
+            "verification": {"confidence": entry["confidence"]},
+            "sources": entry["sources"],
+            "key_facts": entry["key_facts"],
+        }
+        performance_metrics = query_logger.capture_performance_metrics()
+        performance_metrics.cache_hits = 1
+        query_log_entry = QueryLog(
+            timestamp=datetime.now().isoformat(),
+            session_id=session_id,
+            query=query,
+            query_type="normal",
+            model_name=config.OLLAMA_MODEL,
+            model_response=entry["answer"],
+            response_sources=entry["sources"],
+            quality_metrics=query_logger.calculate_quality_metrics(replayed, [], entry["answer"]),
+            performance_metrics=performance_metrics,
+            metadata={"semantic_cache_hit": True, "similarity": similarity}
+        )
+        await asyncio.to_thread(query_logger.log_query, query_log_entry)
+    except Exception as log_error:
+        logger.error(f"Failed to log semantic cache hit: {log_error}", exc_info=True)
+
+
+def _finalize_answer(
+    response: Dict[str, Any],
+    evidences: List[Dict],
+    *,
+    query: str,
+    allowed_docs: Optional[List[str]],
+    fixed_citation_map: Optional[Dict[str, int]]
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Ground, validate, cite and format a generated answer
+
+    Each stage consumes the previous one's output, so the whole chain is
+    CPU-bound sequential work meant to run in a worker thread.
+    """
+    response = get_response_grounder().ground(response, evidences)
+    response = postprocessor.process(response, evidences, query=query)
+    response, validation_issues = get_response_validator().validate_and_correct(response, evidences)
+
+    # SIMPLIFIED: Trust evidence filtering from retrieval stage
+    response = enforcer.enforce_evidence(response, evidences, allowed_doc_ids=None)
+    # Pass allowed_docs for logging only, not for filtering
+    response = citation_tracker.track_citations(
+        response,
+        evidences,
+        allowed_doc_ids=allowed_docs,
+        fixed_citation_map=fixed_citation_map
+    )
+    # SIMPLIFIED: Trust citation tracker's work, no additional filtering
+    response = formatter.format_response(response, allowed_doc_ids=None)
+    return response, validation_issues
+
+
+async def _wait_for_disconnect(http_request: Request):
+    """Block until the client disconnects, without polling"""
+    while True:
+        message = await http_request.receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
 def get_title_generator() -> TitleGenerator:
     global title_generator
     if title_generator is None:
         title_generator = TitleGenerator()
     return title_generator
 
+# 중단 메시지 문구 (세션 기록과 WebSocket 프레임에서 공통 사용)
+_INTERRUPTED_MSG = "답변 생성이 중단되었습니다"
+_INTERRUPTED_MSG_DOT = _INTERRUPTED_MSG + "."
+
+# 빈 질문에 대한 안내 응답 (검증/직렬화를 매번 반복하지 않도록 미리 생성)
+_EMPTY_QUERY_ANSWER = "질문을 입력해 주시면 답변을 드리겠습니다."
+_EMPTY_QUERY_BODY = orjson.dumps(
+    QueryResponse(query="", answer=_EMPTY_QUERY_ANSWER, key_facts=[], sources=[]).model_dump(mode="json")
+)
+
+# 변하지 않는 WebSocket 프레임은 한 번만 직렬화
+_PONG_FRAME = orjson.dumps({"type": "pong"}).decode()
+_STOPPED_FRAME = orjson.dumps({"type": "stopped", "message": _INTERRUPTED_MSG}).decode()
+_ERROR_FRAME = orjson.dumps({"type": "error", "message": "처리 중 오류가 발생했습니다"}).decode()
+
+# 스트리밍 토큰은 이 글자 수 또는 간격에 도달할 때까지 모아서 한 번에 전송 (NDJSON, WebSocket 공통)
+_STREAM_FLUSH_CHARS = 64
+_STREAM_FLUSH_INTERVAL_S = 0.05
+
 # WebSocket connections management
 class ConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
-        self.session_locks: Dict[str, asyncio.Lock] = {}
+        # Locks live as long as a connected websocket references them
+        self.session_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        self._mgr_lock = asyncio.Lock()
     
     async def connect(self, websocket: WebSocket, session_id: str):
         await websocket.accept()
-        self.active_connections[session_id] = websocket
-        if session_id not in self.session_locks:
-            self.session_locks[session_id] = asyncio.Lock()
+        async with self._mgr_lock:
+            self.active_connections[session_id] = websocket
+            websocket.state.lock = self._session_lock(session_id)
         logger.info(f"WebSocket connected for session {session_id}")
     
-    def disconnect(self, session_id: str):
-        if session_id in self.active_connections:
-            del self.active_connections[session_id]
+    async def disconnect(self, session_id: str, websocket: Optional[WebSocket] = None):
+        async with self._mgr_lock:
+            current = self.active_connections.get(session_id)
+            # A reconnect may already have replaced this websocket
+            if current is not None and (websocket is None or current is websocket):
+                self.active_connections.pop(session_id, None)
         logger.info(f"WebSocket disconnected for session {session_id}")
     
+    def _session_lock(self, session_id: str) -> asyncio.Lock:
+        lock = self.session_locks.get(session_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.session_locks[session_id] = lock
+        return lock
+    
     async def send_message(self, session_id: str, message: dict):
+        await self.send_frame(session_id, orjson.dumps(message, option=_NDJSON_OPTIONS).decode())
+
+    async def send_frame(self, session_id: str, frame: str):
+        """이미 직렬화된 JSON 프레임 전송"""
         if session_id in self.active_connections:
             try:
-                await self.active_connections[session_id].send_json(message)
+                # 프론트엔드가 JSON.parse(event.data)로 읽으므로 텍스트 프레임으로 전송
+                await self.active_connections[session_id].send_text(frame)
             except Exception as e:
                 logger.error(f"Failed to send WebSocket message: {e}")
     
@@ -326,17 +567,36 @@ class ConnectionManager:
 manager = ConnectionManager()
 
 # Session endpoints
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
-class CreateSessionRequest(BaseModel):
+class _SessionScopeRequest(BaseModel):
     title: Optional[str] = None
     document_ids: Optional[List[str]] = None
 
-@router.post("/sessions")
+    @field_validator("document_ids", mode="before")
+    @classmethod
+    def _normalize_document_ids(cls, value: Any) -> Any:
+        """NFC-normalize and deduplicate document IDs once while parsing
+
+        None is kept as-is so updates can leave the scope unchanged.
+        Extensions are kept to match what was indexed.
+        """
+        if not value or not isinstance(value, (list, tuple)):
+            return value
+        doc_ids = [doc_id for doc_id in value if isinstance(doc_id, str) and doc_id]
+        # 전부 ASCII면 이미 NFC이므로 한 번의 검사로 정규화를 건너뜀
+        if "".join(doc_ids).isascii():
+            return list(dict.fromkeys(doc_ids))
+        return list(dict.fromkeys(nfc_doc_id(doc_id) for doc_id in doc_ids))
+
+class CreateSessionRequest(_SessionScopeRequest):
+    pass
+
+@router.post("/sessions", response_model=None)
 async def create_session(request: CreateSessionRequest) -> Dict:
     """새 채팅 세션 생성"""
     try:
-        session = await session_manager.create_session(request.title, _normalize_doc_ids(request.document_ids))
+        session = await session_manager.create_session(request.title, request.document_ids)
         return {
             "success": True,
             "session": session.to_dict()
@@ -345,7 +605,7 @@ async def create_session(request: CreateSessionRequest) -> Dict:
         logger.error(f"Failed to create session: {e}")
         raise HTTPException(status_code=500, detail="세션 생성에 실패했습니다")
 
-@router.get("/sessions")
+@router.get("/sessions", response_model=None)
 async def list_sessions(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100)
@@ -364,7 +624,7 @@ async def list_sessions(
         logger.error(f"Failed to list sessions: {e}")
         raise HTTPException(status_code=500, detail="세션 목록 조회에 실패했습니다")
 
-@router.get("/sessions/{session_id}")
+@router.get("/sessions/{session_id}", response_model=None)
 async def get_session(session_id: str) -> Dict:
     """특정 세션 조회"""
     try:
@@ -382,18 +642,17 @@ async def get_session(session_id: str) -> Dict:
         logger.error(f"Failed to get session {session_id}: {e}")
         raise HTTPException(status_code=500, detail="세션 조회에 실패했습니다")
 
-class UpdateSessionRequest(BaseModel):
-    title: Optional[str] = None
-    document_ids: Optional[List[str]] = None
+class UpdateSessionRequest(_SessionScopeRequest):
+    pass
 
-@router.put("/sessions/{session_id}")
+@router.put("/sessions/{session_id}", response_model=None)
 async def update_session(
     session_id: str,
     request: UpdateSessionRequest
 ) -> Dict:
     """세션 정보 업데이트"""
     try:
-        session = await session_manager.update_session(session_id, request.title, _normalize_doc_ids(request.document_ids))
+        session = await session_manager.update_session(session_id, request.title, request.document_ids)
         if not session:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
         
@@ -407,13 +666,14 @@ async def update_session(
         logger.error(f"Failed to update session {session_id}: {e}")
         raise HTTPException(status_code=500, detail="세션 업데이트에 실패했습니다")
 
-@router.delete("/sessions/{session_id}")
+@router.delete("/sessions/{session_id}", response_model=None)
 async def delete_session(session_id: str) -> Dict:
     """세션 삭제"""
     try:
         success = await session_manager.delete_session(session_id)
         if not success:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+        semantic_cache.invalidate_session(session_id)
         
         return {
             "success": True,
@@ -437,64 +697,65 @@ async def send_message(
     # 연결 상태 체크 (항상 활성화)
     cancelled = False
     cancel_event = asyncio.Event()
+    # Timeout scope of the step in flight; a disconnect expires it immediately
+    active_scope: Optional[asyncio.Timeout] = None
 
     async def check_client_disconnect():
         nonlocal cancelled
         try:
-            while not cancelled:
-                try:
-                    if await http_request.is_disconnected():
-                        cancelled = True
-                        cancel_event.set()
-                        logger.info(f"Client disconnected for session {session_id}")
-                        # 중단 메시지를 세션에 저장 (중복 저장 방지: 최근 메시지 확인은 클라이언트에서 처리)
-                        await session_manager.add_message(
-                            session_id,
-                            "assistant",
-                            "답변 생성이 중단되었습니다. 페이지가 새로고침되었거나 요청이 취소되었습니다.",
-                            metadata={"interrupted": True, "reason": "client_disconnect"}
-                        )
-                        break
-                except Exception as e:
-                    logger.debug(f"Error checking disconnect: {e}")
-                    break
-                await asyncio.sleep(0.5)
+            await _wait_for_disconnect(http_request)
         except asyncio.CancelledError:
             # 정상 취소
-            pass
+            return
+        except Exception as e:
+            logger.debug(f"Error checking disconnect: {e}")
+            return
+
+        if cancelled:
+            return
+        cancelled = True
+        cancel_event.set()
+        if active_scope is not None:
+            active_scope.reschedule(asyncio.get_running_loop().time())
+        logger.info(f"Client disconnected for session {session_id}")
+        # 중단 메시지를 세션에 저장 (중복 저장 방지: 최근 메시지 확인은 클라이언트에서 처리)
+        await session_manager.add_message(
+            session_id,
+            "assistant",
+            f"{_INTERRUPTED_MSG_DOT} 페이지가 새로고침되었거나 요청이 취소되었습니다.",
+            metadata={"interrupted": True, "reason": "client_disconnect"}
+        )
+
+    # Validate before starting the disconnect watcher; trivial and rejected requests skip it
+    # Rate limiting and session lookup are independent
+    within_limit, session = await asyncio.gather(
+        rate_limiter.check_limit(session_id),
+        session_manager.get_session(session_id)
+    )
+    if not within_limit:
+        raise HTTPException(status_code=429, detail="너무 많은 요청입니다. 잠시 후 다시 시도해 주세요")
+    
+    # Session validation
+    if not session:
+        raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+    
+    # Input validation
+    if not request.query or not request.query.strip():
+        # 질문이 입력되지 않은 경우 - 출처 없이 간단한 안내 메시지만 반환
+        await session_manager.add_message(
+            session_id,
+            "assistant",
+            _EMPTY_QUERY_ANSWER,
+            sources=[]  # 출처 없음
+        )
+        return Response(content=_EMPTY_QUERY_BODY, media_type="application/json")
+    
+    if len(request.query) > 2000:
+        raise HTTPException(status_code=400, detail="메시지가 너무 깁니다. 짧게 나누어 보내주세요")
 
     disconnect_task = asyncio.create_task(check_client_disconnect())
     
     try:
-        # Rate limiting
-        if not await rate_limiter.check_limit(session_id):
-            raise HTTPException(status_code=429, detail="너무 많은 요청입니다. 잠시 후 다시 시도해 주세요")
-        
-        # Session validation
-        session = await session_manager.get_session(session_id)
-        if not session:
-            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
-        
-        # Input validation
-        if not request.query or not request.query.strip():
-            # 질문이 입력되지 않은 경우 - 출처 없이 간단한 안내 메시지만 반환
-            await session_manager.add_message(
-                session_id,
-                "assistant",
-                "질문을 입력해 주시면 답변을 드리겠습니다.",
-                sources=[]  # 출처 없음
-            )
-            return QueryResponse(
-                query="",
-                answer="질문을 입력해 주시면 답변을 드리겠습니다.",
-                key_facts=[],
-                sources=[],  # 출처 없음
-                session_id=session_id
-            )
-        
-        if len(request.query) > 2000:
-            raise HTTPException(status_code=400, detail="메시지가 너무 깁니다. 짧게 나누어 보내주세요")
-        
         # Check if documents are uploaded
         # Note: Allow empty list [] or None for full index search
         # Only block if document_ids is explicitly an empty list AND index is empty
@@ -525,6 +786,7 @@ async def send_message(
         previous_sources: List[Dict[str, Any]] = []
         previous_doc_ids: List[str] = []
         first_assistant_found = False
+        messages_scanned = False
 
         # reset_context 플래그가 있으면 컨텍스트 초기화
         if request.reset_context:
@@ -547,14 +809,11 @@ async def send_message(
         elif session.first_response_evidences:
             first_assistant_found = True
             # Extract doc_ids from stored evidences (문서 범위만 사용)
-            previous_doc_ids = list(set([
-                e.get("doc_id")
-                for e in session.first_response_evidences
-                if e.get("doc_id")
-            ]))
+            previous_doc_ids = _extract_unique_doc_ids(session.first_response_evidences)
             logger.info(f"Using doc scope from first response: docs: {previous_doc_ids} (will search for new evidences)")
         else:
             # 첫 번째 assistant 메시지의 출처를 찾아서 고정
+            messages_scanned = True
             for message in session.messages:
                 if message.role == "assistant" and message.sources and not first_assistant_found:
                     previous_sources = message.sources
@@ -568,7 +827,8 @@ async def send_message(
                     break
 
         # 첫 번째 assistant가 없으면 가장 최근 것을 사용 (폴백)
-        if not first_assistant_found:
+        # 전체를 이미 훑었는데 없었다면 역방향 재검색은 생략
+        if not first_assistant_found and not messages_scanned:
             for message in reversed(session.messages):
                 if message.role == "assistant" and message.sources:
                     previous_sources = message.sources
@@ -595,7 +855,8 @@ async def send_message(
         # 사용자가 명시적으로 문서를 지정했는지 확인
         requested_doc_ids = []
         if request.doc_ids:
-            requested_doc_ids = [doc_id for doc_id in request.doc_ids if doc_id in session.document_ids]
+            session_doc_set = set(session.document_ids)
+            requested_doc_ids = [doc_id for doc_id in request.doc_ids if doc_id in session_doc_set]
             if not requested_doc_ids:
                 raise HTTPException(status_code=400, detail="요청한 문서를 세션에서 찾을 수 없습니다")
 
@@ -614,6 +875,38 @@ async def send_message(
             logger.info("Context reset requested - clearing previous sources")
             previous_doc_ids = []
 
+        # Near-duplicate questions in the same document scope reuse the stored answer
+        cache_scope = requested_doc_ids or session.document_ids or []
+        query_embedding = await asyncio.to_thread(_embed_for_cache, get_retriever(), retrieval_query)
+        cached = None
+        if query_embedding is not None and not request.reset_context:
+            cached = semantic_cache.get(session_id, cache_scope, query_embedding)
+        if cached is not None:
+            entry, similarity = cached
+            logger.info(f"Semantic cache hit for session {session_id} (similarity={similarity:.3f})")
+            response_metadata = _semantic_cache_metadata(entry, similarity)
+            await session_manager.add_message(
+                session_id,
+                "assistant",
+                entry["content"],
+                sources=entry["sources"],
+                metadata=response_metadata
+            )
+            await _log_semantic_cache_hit(session_id, request.query, entry, similarity)
+            return QueryResponse(
+                query=request.query,
+                answer=entry["answer"],
+                key_facts=entry["key_facts"],
+                details=entry["details"],
+                sources=entry["sources"],
+                formatted_text=entry["formatted_text"],
+                formatted_html=entry["formatted_html"],
+                formatted_markdown=entry["formatted_markdown"],
+                confidence=entry["confidence"],
+                session_id=session_id,
+                metadata=response_metadata
+            )
+
         # 이전 답변의 sources를 사용할지 결정
         should_use_previous_sources = bool(previous_doc_ids) and not requested_doc_ids and not request.reset_context
         topic_change_detected = False
@@ -628,16 +921,26 @@ async def send_message(
             logger.info(f"Retrieving for query: {request.query}")
             logger.info(f"Session document IDs: {session.document_ids}")
 
+            # BM25 + vector search is blocking; run it in a worker and stop waiting on disconnect
+            if cancel_event.is_set():
+                raise HTTPException(status_code=499, detail="Client closed request")
             retriever_instance = get_retriever()
-            resolution = _resolve_evidences(
-                query=request.query,
-                retrieval_query=retrieval_query,
-                retriever_instance=retriever_instance,
-                requested_doc_ids=requested_doc_ids,
-                session_doc_ids=session.document_ids or [],
-                previous_doc_ids=previous_doc_ids,
-                should_use_previous_sources=should_use_previous_sources,
-            )
+            try:
+                async with asyncio.timeout(None) as active_scope:
+                    resolution = await asyncio.to_thread(
+                        _resolve_evidences,
+                        query=request.query,
+                        retrieval_query=retrieval_query,
+                        retriever_instance=retriever_instance,
+                        requested_doc_ids=requested_doc_ids,
+                        session_doc_ids=session.document_ids or [],
+                        previous_doc_ids=previous_doc_ids,
+                        should_use_previous_sources=should_use_previous_sources,
+                    )
+            except TimeoutError:
+                raise HTTPException(status_code=499, detail="Client closed request")
+            finally:
+                active_scope = None
 
             if resolution.status == "no_evidence":
                 response_text = resolution.error_message or "업로드된 문서에서 해당 정보를 찾을 수 없습니다."
@@ -726,15 +1029,13 @@ async def send_message(
             # SIMPLIFIED: NO additional filtering after reranking
             # Trust that evidences are already properly filtered from retrieval
             reranker_instance = get_reranker()
-            if reranker_instance and (
-                reranker_instance.model or (
-                    reranker_instance.use_onnx and hasattr(reranker_instance, 'ort_session')
-                )
-            ):
-                evidences = reranker_instance.rerank(
+            if reranker_instance and reranker_instance.is_ready():
+                evidences = await asyncio.to_thread(
+                    reranker_instance.rerank,
                     retrieval_query,
                     evidences,
-                    top_k=config.TOPK_RERANK
+                    top_k=config.TOPK_RERANK,
+                    batch_size=config.RERANK_BATCH
                 )
                 logger.info(f"Reranked {len(evidences)} evidences for query")
             else:
@@ -744,7 +1045,7 @@ async def send_message(
             if cancel_event.is_set():
                 raise HTTPException(status_code=499, detail="Client closed request")
 
-            # 3. Generate with context (취소 가능 태스크로 실행)
+            # 3. Generate with context (연결 종료 또는 시간 초과 시 취소)
             logger.info("="*80)
             logger.info("GENERATION INPUT:")
             logger.info(f"  Query: {request.query}")
@@ -753,57 +1054,27 @@ async def send_message(
             logger.info(f"  Doc scope: {doc_scope_metadata}")
             logger.info("="*80)
 
-            gen_task = asyncio.create_task(
-                get_generator().generate_with_context(
-                    request.query,
-                    evidences,
-                    context=context,
-                    doc_scope=doc_scope_metadata,
-                    stream=False
-                )
-            )
+            try:
+                async with asyncio.timeout(config.GEN_TIMEOUT_S) as active_scope:
+                    response = await get_generator().generate_with_context(
+                        request.query,
+                        evidences,
+                        context=context,
+                        doc_scope=doc_scope_metadata,
+                        stream=False
+                    )
+            except TimeoutError:
+                if cancel_event.is_set():
+                    raise HTTPException(status_code=499, detail="Client closed request")
+                raise HTTPException(status_code=504, detail="답변 생성 시간이 초과되었습니다")
+            finally:
+                active_scope = None
 
-            # cancel_event 와 경합
-            cancel_wait = asyncio.create_task(cancel_event.wait())
-            done, pending = await asyncio.wait({gen_task, cancel_wait}, return_when=asyncio.FIRST_COMPLETED)
-            
-            # 정리
-            cancel_wait.cancel()
-
-            if gen_task in done:
-                response = gen_task.result()
-                # Sanitize any think tags from non-streamed content
-                def strip_think_sections(text: str) -> str:
-                    if not isinstance(text, str) or not text:
-                        return text
-                    try:
-                        import re
-                        patterns = [
-                            r'(?is)<think>.*?</think>',
-                            r'(?is)<thinking>.*?</thinking>',
-                            r'(?is)\[think\].*?\[/think\]'
-                        ]
-                        for p in patterns:
-                            text = re.sub(p, '', text)
-                        # Remove any stray residual tags
-                        text = re.sub(r'(?is)</?thinking?>', '', text)
-                        text = re.sub(r'(?is)\[/?think\]', '', text)
-                        return text.strip()
-                    except Exception:
-                        return text
-                if isinstance(response, dict):
-                    if 'answer' in response:
-                        response['answer'] = strip_think_sections(response.get('answer', ''))
-                    if 'details' in response:
-                        response['details'] = strip_think_sections(response.get('details', ''))
-            else:
-                # 취소 발생: 생성 태스크 취소
-                gen_task.cancel()
-                try:
-                    await gen_task
-                except asyncio.CancelledError:
-                    pass
-                raise HTTPException(status_code=499, detail="Client closed request")
+            # Sanitize any think tags from non-streamed content
+            if isinstance(response, dict):
+                for key in ('answer', 'details'):
+                    if key in response:
+                        response[key] = _strip_think_sections(response[key])
             
             # 4. Ground and verify response (respect resolved scope)
             logger.info("="*80)
@@ -814,29 +1085,14 @@ async def send_message(
             logger.info(f"  sources: {len(response.get('sources', []))} items")
             logger.info("="*80)
 
-            response = get_response_grounder().ground(response, evidences)
-            response = postprocessor.process(response, evidences, query=request.query)
-
-            response_validator = get_response_validator()
-            response, validation_issues = response_validator.validate_and_correct(response, evidences)
-            if validation_issues:
-                logger.info("Response validator issues: %s", validation_issues[:5])
-
-            # SIMPLIFIED: Trust evidence filtering from retrieval stage
-            # NO additional source filtering here
-            response = enforcer.enforce_evidence(response, evidences, allowed_doc_ids=None)
-
             # 5. Track citations
-            # Pass allowed_docs for logging only, not for filtering
-            allowed_docs = allowed_docs_enforce
-
             # Use fixed citation map for follow-up questions
             # IMPROVED: More lenient matching for citation map stability
             fixed_citation_map = None
             if should_use_previous_sources and session.first_response_citation_map:
                 logger.info(f"🔵 FOLLOW-UP MODE - Evaluating fixed citation map usage")
                 logger.info(f"  - Evidence count: {len(evidences)}")
-                logger.info(f"  - Allowed docs: {allowed_docs}")
+                logger.info(f"  - Allowed docs: {allowed_docs_enforce}")
                 logger.info(f"  - Topic change: {topic_change_detected}")
 
                 # Only disable if topic explicitly changed
@@ -850,40 +1106,33 @@ async def send_message(
                     fixed_citation_map = session.first_response_citation_map
                     logger.info(f"✅ Using fixed citation map: {fixed_citation_map}")
 
-            response = citation_tracker.track_citations(response, evidences, allowed_doc_ids=allowed_docs, fixed_citation_map=fixed_citation_map)
-
-            # 🔍 DEBUGGING: Log sources count after citation_tracker
-            logger.info("🔍 DEBUG - After citation_tracker.track_citations():")
-            logger.info(f"  sources count: {len(response.get('sources', []))}")
-            for idx, src in enumerate(response.get('sources', [])[:5]):
-                logger.info(f"  Source {idx+1}: doc_id={src.get('doc_id')}, page={src.get('page')}, chunk_id={src.get('chunk_id')}")
+            # 6. Ground, cite and format off the event loop
+            response, validation_issues = await asyncio.to_thread(
+                _finalize_answer,
+                response,
+                evidences,
+                query=request.query,
+                allowed_docs=allowed_docs_enforce,
+                fixed_citation_map=fixed_citation_map
+            )
+            if validation_issues:
+                logger.info("Response validator issues: %s", validation_issues[:5])
 
-            # 6. Format response
-            # SIMPLIFIED: Trust citation tracker's work, no additional filtering
-            response = formatter.format_response(response, allowed_doc_ids=None)
+            sources = response.get("sources", [])
 
             # 🔍 DEBUGGING: Log sources count after formatter
             logger.info("🔍 DEBUG - After formatter.format_response():")
-            logger.info(f"  sources count: {len(response.get('sources', []))}")
-            for idx, src in enumerate(response.get('sources', [])[:5]):
+            logger.info(f"  sources count: {len(sources)}")
+            for idx, src in enumerate(sources[:5]):
                 logger.info(f"  Source {idx+1}: doc_id={src.get('doc_id')}, page={src.get('page')}, chunk_id={src.get('chunk_id')}")
 
             logger.info("="*80)
             logger.info("AFTER FORMATTING:")
             logger.info(f"  formatted_text: {response.get('formatted_text', '')[:500]}")
             logger.info(f"  formatted_markdown: {response.get('formatted_markdown', '')[:500]}")
-            logger.info(f"  sources: {len(response.get('sources', []))} items")
+            logger.info(f"  sources: {len(sources)} items")
             logger.info("="*80)
 
-            # Add assistant message
-            sources = response.get("sources", [])
-
-            # 🔍 DEBUGGING: Log sources after extraction
-            logger.info(f"🔍 DEBUG - After extracting sources from response:")
-            logger.info(f"  sources count: {len(sources)}")
-            for idx, src in enumerate(sources[:5]):
-                logger.info(f"  Source {idx+1}: doc_id={src.get('doc_id')}, page={src.get('page')}, chunk_id={src.get('chunk_id')}")
-
             # 후속 답변인 경우 sources 검증
             if should_use_previous_sources:
                 if not sources:
@@ -1042,6 +1291,14 @@ async def send_message(
                 metadata=response_metadata
             )
 
+            if query_embedding is not None:
+                semantic_cache.put(
+                    session_id,
+                    cache_scope,
+                    query_embedding,
+                    _semantic_cache_entry(response, assistant_content, response_metadata)
+                )
+
             logger.info(
                 "Response scope summary",
                 extra={
@@ -1106,7 +1363,7 @@ async def send_message(
                     performance_metrics=performance_metrics,
                     error_info=ErrorInfo()
                 )
-                query_logger.log_query(query_log_entry)
+                await asyncio.to_thread(query_logger.log_query, query_log_entry)
                 logger.info(f"✅ Logged query for session {session_id}")
             except Exception as log_error:
                 logger.error(f"Failed to log query: {log_error}", exc_info=True)
@@ -1129,6 +1386,8 @@ async def send_message(
             # 취소된 경우 이미 중단 메시지가 저장되었으므로 추가 처리 불필요
             logger.info(f"Request cancelled for session {session_id}")
             raise HTTPException(status_code=499, detail="Client closed request")
+        except HTTPException:
+            raise
         except Exception as e:
             if not cancelled:
                 error_msg = error_handler.handle_rag_error(e)
@@ -1176,55 +1435,43 @@ async def send_message_stream(
     async def monitor_disconnect():
         nonlocal interrupt_recorded
         try:
-            while not cancel_event.is_set():
-                if await http_request.is_disconnected():
-                    logger.info(f"[stream] Client disconnected for session {session_id}")
-                    cancel_event.set()
-                    if not interrupt_recorded:
-                        try:
-                            await session_manager.add_message(
-                                session_id,
-                                "assistant",
-                                "답변 생성이 중단되었습니다.",
-                                metadata={"interrupted": True, "reason": "client_disconnect"}
-                            )
-                            interrupt_recorded = True
-                        except Exception as e:
-                            logger.error(f"Failed to record interrupt on disconnect: {e}")
-                    break
-                await asyncio.sleep(0.25)
+            await _wait_for_disconnect(http_request)
         except Exception as e:
             logger.debug(f"monitor_disconnect error: {e}")
+            return
+
+        if cancel_event.is_set():
+            return
+        logger.info(f"[stream] Client disconnected for session {session_id}")
+        cancel_event.set()
+        if not interrupt_recorded:
+            try:
+                await session_manager.add_message(
+                    session_id,
+                    "assistant",
+                    _INTERRUPTED_MSG_DOT,
+                    metadata={"interrupted": True, "reason": "client_disconnect"}
+                )
+                interrupt_recorded = True
+            except Exception as e:
+                logger.error(f"Failed to record interrupt on disconnect: {e}")
 
     monitor_task = asyncio.create_task(monitor_disconnect())
 
     async def generate():
+        nonlocal interrupt_recorded
         full_response = ""
-        # Streaming-time think-tag filter state
-        in_think = False
-        pending = ""
-        start_tags = [("<think>", 7), ("<thinking>", 11), ("[think]", 7)]
-        end_tags = [("</think>", 8), ("</thinking>", 12), ("[/think]", 8)]
-
-        def find_any(haystack_lower, tags):
-            idx = -1
-            tag_len = 0
-            for t, tlen in tags:
-                i = haystack_lower.find(t)
-                if i != -1 and (idx == -1 or i < idx):
-                    idx = i
-                    tag_len = tlen
-            return idx, tag_len
+        think_filter = _ThinkTagFilter()
 
         try:
             # Session validation
             session = await session_manager.get_session(session_id)
             if not session:
-                yield json.dumps({"error": "세션을 찾을 수 없습니다"}) + "\n"
+                yield _ndjson({"error": "세션을 찾을 수 없습니다"})
                 return
 
             if not request.query or not request.query.strip():
-                yield json.dumps({"error": "메시지를 입력해 주세요"}) + "\n"
+                yield _ndjson({"error": "메시지를 입력해 주세요"})
                 return
 
             # Check if documents are uploaded
@@ -1234,10 +1481,10 @@ async def send_message_stream(
                     from rag.whoosh_bm25 import WhooshBM25
                     whoosh_bm25 = WhooshBM25()
                     if whoosh_bm25.get_doc_count() == 0:
-                        yield json.dumps({
+                        yield _ndjson({
                             "error": "NO_DOCUMENTS",
                             "message": "먼저 문서를 업로드해 주세요"
-                        }) + "\n"
+                        })
                         return
                 except Exception as e:
                     logger.warning(f"Could not check document count: {e}")
@@ -1260,11 +1507,7 @@ async def send_message_stream(
             if session.first_response_evidences:
                 first_assistant_found = True
                 # Extract doc_ids from stored evidences (문서 범위만 사용)
-                previous_doc_ids = list(set([
-                    e.get("doc_id")
-                    for e in session.first_response_evidences
-                    if e.get("doc_id")
-                ]))
+                previous_doc_ids = _extract_unique_doc_ids(session.first_response_evidences)
                 logger.info(f"Streaming: Using doc scope from first response: docs: {previous_doc_ids} (will search for new evidences)")
             else:
                 # 첫 번째 assistant 메시지의 출처를 찾아서 고정
@@ -1280,19 +1523,6 @@ async def send_message_stream(
                         logger.info(f"Streaming: Using first assistant message sources: {previous_doc_ids}")
                         break
 
-            # 첫 번째 assistant가 없으면 가장 최근 것을 사용 (폴백)
-            if not first_assistant_found:
-                for message in reversed(session.messages):
-                    if message.role == "assistant" and message.sources:
-                        previous_sources = message.sources
-                        previous_doc_ids = [
-                            src.get("doc_id")
-                            for src in message.sources
-                            if isinstance(src, dict) and src.get("doc_id")
-                        ]
-                        logger.info(f"Streaming: Using recent assistant message sources (fallback): {previous_doc_ids}")
-                        break
-
             recent_for_rewrite = context_messages[-4:] if context_messages else []
             rewrite_context = RewriteContext(
                 current_query=request.query,
@@ -1307,11 +1537,39 @@ async def send_message_stream(
             # Determine retrieval scope
             requested_doc_ids: List[str] = []
             if request.doc_ids:
-                requested_doc_ids = [doc_id for doc_id in request.doc_ids if doc_id in session.document_ids]
+                session_doc_set = set(session.document_ids)
+                requested_doc_ids = [doc_id for doc_id in request.doc_ids if doc_id in session_doc_set]
                 if not requested_doc_ids:
-                    yield json.dumps({"error": "요청한 문서를 세션에서 찾을 수 없습니다"}) + "\n"
+                    yield _ndjson({"error": "요청한 문서를 세션에서 찾을 수 없습니다"})
                     return
 
+            # Near-duplicate questions in the same document scope reuse the stored answer
+            cache_scope = requested_doc_ids or session.document_ids or []
+            query_embedding = await asyncio.to_thread(_embed_for_cache, get_retriever(), retrieval_query)
+            cached = None
+            if query_embedding is not None and not request.reset_context:
+                cached = semantic_cache.get(session_id, cache_scope, query_embedding)
+            if cached is not None:
+                entry, similarity = cached
+                logger.info(f"Streaming: Semantic cache hit for session {session_id} (similarity={similarity:.3f})")
+                response_metadata = {**_semantic_cache_metadata(entry, similarity), "streaming": True}
+                yield _ndjson_content(entry["answer"])
+                await session_manager.add_message(
+                    session_id,
+                    "assistant",
+                    entry["content"],
+                    sources=entry["sources"],
+                    metadata=response_metadata
+                )
+                await _log_semantic_cache_hit(session_id, request.query, entry, similarity)
+                yield _ndjson({
+                    "complete": True,
+                    "answer": entry["content"],
+                    "sources": entry["sources"],
+                    "metadata": response_metadata,
+                })
+                return
+
             should_use_previous_sources = bool(previous_doc_ids) and not requested_doc_ids
             doc_scope_metadata: Dict[str, Any] = {}
             allowed_docs_enforce: Optional[List[str]] = None
@@ -1321,15 +1579,16 @@ async def send_message_stream(
             topic_change_suggested: List[str] = []
 
             # Send status update
-            yield json.dumps({
+            yield _ndjson({
                 "status": "문서 검색 중...",
                 "metadata": {
                     "rewrite_used_fallback": rewrite_result.used_fallback
                 }
-            }) + "\n"
+            })
 
             retriever_instance = get_retriever()
-            resolution = _resolve_evidences(
+            resolution = await asyncio.to_thread(
+                _resolve_evidences,
                 query=request.query,
                 retrieval_query=retrieval_query,
                 retriever_instance=retriever_instance,
@@ -1341,10 +1600,10 @@ async def send_message_stream(
 
             if resolution.status == "no_evidence":
                 message = resolution.error_message or "업로드된 문서에서 해당 정보를 찾을 수 없습니다."
-                yield json.dumps({
+                yield _ndjson({
                     "error": "no_evidence",
                     "message": message
-                }) + "\n"
+                })
                 await session_manager.add_message(
                     session_id,
                     "assistant",
@@ -1368,28 +1627,27 @@ async def send_message_stream(
                 return
 
             # Send status update
-            yield json.dumps({
+            yield _ndjson({
                 "status": "문서 검색 완료",
                 "metadata": {
                     "doc_scope": doc_scope_metadata,
                     "rewrite_used_fallback": rewrite_result.used_fallback
                 }
-            }) + "\n"
+            })
 
             # Send status update for generation
-            yield json.dumps({"status": "답변 생성 중..."}) + "\n"
+            yield _ndjson({"status": "답변 생성 중..."})
 
             # Rerank if available
             # SIMPLIFIED: Same as non-streaming endpoint
             reranker_instance = get_reranker()
-            if reranker_instance and (
-                getattr(reranker_instance, "model", None)
-                or (getattr(reranker_instance, "use_onnx", False) and hasattr(reranker_instance, "ort_session"))
-            ):
-                evidences = reranker_instance.rerank(
+            if reranker_instance and reranker_instance.is_ready():
+                evidences = await asyncio.to_thread(
+                    reranker_instance.rerank,
                     retrieval_query,
                     evidences,
-                    top_k=config.TOPK_RERANK
+                    top_k=config.TOPK_RERANK,
+                    batch_size=config.RERANK_BATCH
                 )
                 logger.info(f"Streaming: Reranked {len(evidences)} evidences")
             else:
@@ -1403,52 +1661,24 @@ async def send_message_stream(
                 doc_scope=doc_scope_metadata,
                 cancel_event=cancel_event
             )
+            pending = ""
+            last_flush = time.monotonic()
             try:
                 async for chunk in agen:
                     if cancel_event.is_set():
                         break
                     if not chunk:
                         continue
-                    # Append and filter think sections
-                    pending += chunk
-                    while True:
-                        lbuf = pending.lower()
-                        if not in_think:
-                            s_idx, s_len = find_any(lbuf, start_tags)
-                            if s_idx != -1:
-                                # Emit content before <think>
-                                if s_idx > 0:
-                                    emit = pending[:s_idx]
-                                    if emit:
-                                        full_response += emit
-                                        yield json.dumps({"content": emit}) + "\n"
-                                # Enter think region
-                                pending = pending[s_idx + s_len:]
-                                in_think = True
-                                continue
-                            else:
-                                # No start tag; emit safe prefix keeping small tail to catch split tags
-                                tail = 16
-                                if len(pending) > tail:
-                                    emit = pending[:-tail]
-                                    pending = pending[-tail:]
-                                    if emit:
-                                        full_response += emit
-                                        yield json.dumps({"content": emit}) + "\n"
-                                break
-                        else:
-                            # Inside think; look for any end tag
-                            e_idx, e_len = find_any(lbuf, end_tags)
-                            if e_idx != -1:
-                                # Drop up to end tag, exit think
-                                pending = pending[e_idx + e_len:]
-                                in_think = False
-                                continue
-                            else:
-                                # Still inside think; keep buffer bounded and wait for more
-                                if len(pending) > 8192:
-                                    pending = pending[-4096:]
-                                break
+                    # Filter think sections
+                    emit = think_filter.feed(chunk)
+                    if emit:
+                        full_response += emit
+                        pending += emit
+                        now = time.monotonic()
+                        if len(pending) >= _STREAM_FLUSH_CHARS or now - last_flush >= _STREAM_FLUSH_INTERVAL_S:
+                            yield _ndjson_content(pending)
+                            pending = ""
+                            last_flush = now
             finally:
                 try:
                     await agen.aclose()
@@ -1456,14 +1686,13 @@ async def send_message_stream(
                     pass
 
             # Flush ALL remaining pending content (important for complete response)
-            if not cancel_event.is_set() and pending:
-                # If we're still in think mode, we should NOT emit the content
-                if not in_think:
-                    emit = pending
-                    pending = ""
-                    if emit:
-                        full_response += emit
-                        yield json.dumps({"content": emit}) + "\n"
+            if not cancel_event.is_set():
+                emit = think_filter.flush()
+                if emit:
+                    full_response += emit
+                    pending += emit
+                if pending:
+                    yield _ndjson_content(pending)
             
             if cancel_event.is_set():
                 # 이미 monitor_disconnect에서 중단 메시지를 기록했을 수 있음
@@ -1472,7 +1701,7 @@ async def send_message_stream(
                         await session_manager.add_message(
                             session_id,
                             "assistant",
-                            "답변 생성이 중단되었습니다.",
+                            _INTERRUPTED_MSG_DOT,
                             metadata={"interrupted": True, "reason": "client_disconnect"}
                         )
                         interrupt_recorded = True
@@ -1489,17 +1718,6 @@ async def send_message_stream(
                 "sources": [],
             }
 
-            response_payload = get_response_grounder().ground(response_payload, evidences)
-            response_payload = postprocessor.process(response_payload, evidences, query=request.query)
-
-            response_validator = get_response_validator()
-            response_payload, validation_issues = response_validator.validate_and_correct(response_payload, evidences)
-            if validation_issues:
-                logger.info("Response validator (stream) issues: %s", validation_issues[:5])
-
-            # SIMPLIFIED: Same logic as non-streaming
-            response_payload = enforcer.enforce_evidence(response_payload, evidences, allowed_doc_ids=None)
-
             # Fixed citation map logic (streaming)
             fixed_citation_map = None
             if should_use_previous_sources and session.first_response_citation_map:
@@ -1509,22 +1727,23 @@ async def send_message_stream(
                     fixed_citation_map = session.first_response_citation_map
                     logger.info(f"Streaming: Using fixed citation map")
 
-            response_payload = citation_tracker.track_citations(
+            # SIMPLIFIED: Same logic as non-streaming
+            response_payload, validation_issues = await asyncio.to_thread(
+                _finalize_answer,
                 response_payload,
                 evidences,
-                allowed_doc_ids=allowed_docs,
+                query=request.query,
+                allowed_docs=allowed_docs,
                 fixed_citation_map=fixed_citation_map
             )
-            response_payload = formatter.format_response(response_payload, allowed_doc_ids=None)
+            if validation_issues:
+                logger.info("Response validator (stream) issues: %s", validation_issues[:5])
 
             assistant_content = response_payload.get("formatted_text", response_payload.get("answer", full_response))
             sources = response_payload.get("sources", [])
 
             source_doc_ids = [s.get("doc_id") for s in sources if s.get("doc_id")]
-            unique_doc_ids: List[str] = []
-            for doc_id in source_doc_ids:
-                if doc_id and doc_id not in unique_doc_ids:
-                    unique_doc_ids.append(doc_id)
+            unique_doc_ids = _deduplicate_doc_ids(source_doc_ids)
 
             doc_scope_metadata = _finalize_doc_scope_metadata(
                 doc_scope_metadata,
@@ -1641,6 +1860,14 @@ async def send_message_stream(
                 metadata=response_metadata
             )
 
+            if query_embedding is not None:
+                semantic_cache.put(
+                    session_id,
+                    cache_scope,
+                    query_embedding,
+                    _semantic_cache_entry(response_payload, assistant_content, response_metadata)
+                )
+
             # 메모리 팩트 저장 비활성화 - 출처 일관성 문제 해결을 위해
             # memory_facts = _collect_memory_facts(response_payload)
             # if memory_facts:
@@ -1698,17 +1925,17 @@ async def send_message_stream(
                     performance_metrics=performance_metrics,
                     error_info=ErrorInfo()
                 )
-                query_logger.log_query(query_log_entry)
+                await asyncio.to_thread(query_logger.log_query, query_log_entry)
             except Exception as log_error:
                 logger.error(f"Failed to log streaming query: {log_error}")
 
             # Send final data with sources
-            yield json.dumps({
+            yield _ndjson({
                 "complete": True,
                 "answer": assistant_content,
                 "sources": sources,
                 "metadata": response_metadata,
-            }) + "\n"
+            })
             
         except ClientDisconnect:
             # 클라이언트 연결 종료: 중단 메시지 저장 후 종료
@@ -1716,7 +1943,7 @@ async def send_message_stream(
                 await session_manager.add_message(
                     session_id,
                     "assistant",
-                    "답변 생성이 중단되었습니다.",
+                    _INTERRUPTED_MSG_DOT,
                     metadata={"interrupted": True, "reason": "client_disconnect"}
                 )
                 interrupt_recorded = True
@@ -1724,12 +1951,14 @@ async def send_message_stream(
                 logger.error(f"Failed to record interrupt on disconnect: {e}")
             return
         except asyncio.CancelledError:
-            # 서버 태스크 취소
+            # 서버 태스크 취소 (연결 종료로 이미 기록된 경우 제외)
+            if interrupt_recorded:
+                return
             try:
                 await session_manager.add_message(
                     session_id,
                     "assistant",
-                    "답변 생성이 중단되었습니다.",
+                    _INTERRUPTED_MSG_DOT,
                     metadata={"interrupted": True, "reason": "server_cancel"}
                 )
             except Exception as e:
@@ -1739,7 +1968,7 @@ async def send_message_stream(
             logger.error(f"Streaming failed: {e}")
             # 에러는 클라이언트에 전송(연결이 살아있을 때만)
             try:
-                yield json.dumps({"error": str(e)}) + "\n"
+                yield _ndjson({"error": str(e)})
             except Exception:
                 pass
         finally:
@@ -1770,7 +1999,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             
             # Process based on message type
             if data.get("type") == "ping":
-                await manager.send_message(session_id, {"type": "pong"})
+                await manager.send_frame(session_id, _PONG_FRAME)
                 
             elif data.get("type") == "message":
                 query = data.get("content", "")
@@ -1793,7 +2022,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                     continue
                 
                 # Process with lock to prevent concurrent processing
-                async with manager.session_locks.get(session_id, asyncio.Lock()):
+                async with websocket.state.lock:
                     try:
                         # Timing start
                         start_time = time.time()
@@ -1809,7 +2038,9 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
 
                         # Get evidences with timing
                         search_start = time.time()
-                        evidences = retriever.retrieve(query, document_ids=session.document_ids)
+                        evidences = await asyncio.to_thread(
+                            retriever.retrieve, query, document_ids=session.document_ids
+                        )
                         search_time_ms = (time.time() - search_start) * 1000
                         
                         if not evidences:
@@ -1832,6 +2063,8 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                         # Stream response with timing
                         generation_start = time.time()
                         full_response = ""
+                        pending = ""
+                        last_flush = time.monotonic()
                         async for chunk in generator.stream_with_context(
                             query,
                             evidences,
@@ -1839,11 +2072,22 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                         ):
                             if chunk:
                                 full_response += chunk
-                                await manager.send_message(session_id, {
-                                    "type": "response",
-                                    "content": chunk,
-                                    "complete": False
-                                })
+                                pending += chunk
+                                now = time.monotonic()
+                                if len(pending) >= _STREAM_FLUSH_CHARS or now - last_flush >= _STREAM_FLUSH_INTERVAL_S:
+                                    await manager.send_message(session_id, {
+                                        "type": "response",
+                                        "content": pending,
+                                        "complete": False
+                                    })
+                                    pending = ""
+                                    last_flush = now
+                        if pending:
+                            await manager.send_message(session_id, {
+                                "type": "response",
+                                "content": pending,
+                                "complete": False
+                            })
                         generation_time_ms = (time.time() - generation_start) * 1000
                         
                         # Process citations
@@ -1913,7 +2157,7 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                                 performance_metrics=performance_metrics,
                                 error_info=ErrorInfo()
                             )
-                            query_logger.log_query(query_log_entry)
+                            await asyncio.to_thread(query_logger.log_query, query_log_entry)
                         except Exception as log_error:
                             logger.error(f"Failed to log query: {log_error}")
 
@@ -1926,44 +2170,32 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
                         
                     except Exception as e:
                         logger.error(f"WebSocket processing error: {e}")
-                        await manager.send_message(session_id, {
-                            "type": "error",
-                            "message": "처리 중 오류가 발생했습니다"
-                        })
+                        await manager.send_frame(session_id, _ERROR_FRAME)
             
             elif data.get("type") == "stop":
                 # Handle stop request
-                await manager.send_message(session_id, {
-                    "type": "stopped",
-                    "message": "답변 생성이 중단되었습니다"
-                })
+                await manager.send_frame(session_id, _STOPPED_FRAME)
                 
     except WebSocketDisconnect:
-        manager.disconnect(session_id)
-    except Exception as e:
-        logger.error(f"WebSocket error: {e}")
-        manager.disconnect(session_id)
+        pass
+    except Exception:
+        logger.exception("WebSocket error")
+    finally:
+        # 정상 종료, 오류, 취소 모두 한 곳에서 연결 해제
+        await manager.disconnect(session_id, websocket)
 
-@router.post("/sessions/{session_id}/interrupt")
+@router.post("/sessions/{session_id}/interrupt", response_model=None)
 async def interrupt_session(session_id: str) -> Dict:
     """세션 중단 처리"""
     try:
-        # 이미 직전 메시지가 중단으로 기록되어 있으면 중복 기록 방지
-        session = await session_manager.get_session(session_id)
-        if session and session.messages:
-            last = session.messages[-1]
-            if (last.metadata and last.metadata.get('interrupted')) or (
-                isinstance(last.content, str) and '답변 생성이 중단되었습니다' in last.content
-            ):
-                return {"success": True, "message": "이미 중단 메시지가 저장되어 있습니다"}
-
-        # 중단 메시지 추가
-        await session_manager.add_message(
+        # 이미 직전 메시지가 중단으로 기록되어 있으면 중복 기록 방지 (확인과 추가를 한 번에)
+        recorded = await session_manager.record_interrupt(
             session_id,
-            "assistant",
-            "답변 생성이 중단되었습니다.",
+            _INTERRUPTED_MSG_DOT,
             metadata={"interrupted": True, "reason": "user_action"}
         )
+        if recorded is False:
+            return {"success": True, "message": "이미 중단 메시지가 저장되어 있습니다"}
         
         return {
             "success": True,
@@ -1973,13 +2205,14 @@ async def interrupt_session(session_id: str) -> Dict:
         logger.error(f"Failed to save interrupt message: {e}")
         raise HTTPException(status_code=500, detail="중단 처리에 실패했습니다")
 
-@router.delete("/sessions/{session_id}/messages")
+@router.delete("/sessions/{session_id}/messages", response_model=None)
 async def clear_messages(session_id: str) -> Dict:
     """세션 메시지 초기화"""
     try:
         success = await session_manager.clear_session_messages(session_id)
         if not success:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+        semantic_cache.invalidate_session(session_id)
         
         return {
             "success": True,
@@ -1991,39 +2224,35 @@ async def clear_messages(session_id: str) -> Dict:
         logger.error(f"Failed to clear messages: {e}")
         raise HTTPException(status_code=500, detail="메시지 초기화에 실패했습니다")
 
+async def _iter_session_export(session: ChatSession, exported_at: str) -> AsyncIterator[bytes]:
+    """Yield {"success", "exported_at", "session_data"} without building it whole"""
+    messages = list(session.messages)
+    # 메시지를 뺀 얕은 복사본으로 헤더만 직렬화 (ChatSession.to_dict와 같은 형태 유지)
+    header = session.model_copy(update={"messages": []}).to_dict()
+    header.pop("messages")
+    yield (
+        b'{"success":true,"exported_at":' + orjson.dumps(exported_at)
+        + b',"session_data":' + orjson.dumps(header, option=_NDJSON_OPTIONS)[:-1]
+        + b',"messages":['
+    )
+    for index, msg in enumerate(messages):
+        yield (b"," if index else b"") + orjson.dumps(msg.to_dict(), option=_NDJSON_OPTIONS)
+    yield b"]}}"
+
 @router.get("/sessions/{session_id}/export")
-async def export_session(session_id: str) -> Dict:
-    """세션 내보내기"""
+async def export_session(session_id: str) -> StreamingResponse:
+    """세션 내보내기 (메시지 단위로 직렬화하며 전송)"""
     try:
-        session_data = await session_manager.export_session(session_id)
-        if not session_data:
+        session = await session_manager.get_session(session_id)
+        if not session:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
         
-        return {
-            "success": True,
-            "session_data": session_data,
-            "exported_at": datetime.now().isoformat()
-        }
+        return StreamingResponse(
+            _iter_session_export(session, datetime.now().isoformat()),
+            media_type="application/json"
+        )
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"Failed to export session: {e}")
         raise HTTPException(status_code=500, detail="세션 내보내기에 실패했습니다")
-def _normalize_doc_ids(doc_ids: Optional[List[str]]) -> Optional[List[str]]:
-    """Normalize document IDs with Unicode normalization"""
-    if not doc_ids:
-        return doc_ids
-
-    import unicodedata
-    normed = []
-    for d in doc_ids:
-        try:
-            if isinstance(d, str):
-                # Apply Unicode normalization first
-                d = unicodedata.normalize('NFC', d)
-                # Keep the original ID as-is to match indexed documents
-                # Don't remove extensions here - they should match what was indexed
-                normed.append(d)
-        except Exception:
-            continue
-    return normed
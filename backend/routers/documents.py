@@ -6,6 +6,8 @@ import logging
 
 from config import config
 from processors.indexer import DocumentIndexer
+from services.semantic_cache import semantic_cache
+from utils.cache import retrieval_cache
 # Import document summarizer (safe import)
 try:
     from services.document_summarizer import DocumentSummarizer
@@ -31,6 +33,12 @@ if SUMMARIZER_AVAILABLE:
 else:
     summarizer = None
 
+
+def _invalidate_search_caches():
+    """Drop cached answers and retrieval results after the index changed"""
+    semantic_cache.clear()
+    retrieval_cache.clear()
+
 # Summary API endpoints - using query parameters to avoid path conflicts
 @router.get("/summary")
 async def get_document_summary(doc_id: str) -> Dict:
@@ -231,6 +239,7 @@ async def upload_document(
         
         # Index immediately and get result
         result = indexer.index_document_sync(absolute_path)
+        _invalidate_search_caches()
         
         return {
             "status": "indexed",
@@ -312,6 +321,10 @@ async def upload_batch(
         finally:
             file.file.close()
     
+    # Cached answers may be stale once the queued documents are indexed
+    if uploaded:
+        background_tasks.add_task(_invalidate_search_caches)
+    
     return {
         "uploaded": uploaded,
         "failed": failed,
@@ -371,6 +384,7 @@ async def delete_document(filename: str) -> Dict:
         
         # Delete physical file
         file_path.unlink()
+        _invalidate_search_caches()
         
         logger.info(f"Deleted document: {filename} (Whoosh: {whoosh_count} chunks, Chroma: {chroma_count} chunks)")
         
@@ -407,6 +421,7 @@ async def reset_all_documents() -> Dict:
         # Clear ChromaDB collection
         chroma = ChromaStore()
         chroma.clear_collection()
+        _invalidate_search_caches()
         
         # Delete all files in document directory
         for file_path in doc_dir.glob("*"):
@@ -466,6 +481,8 @@ async def reindex_all(background_tasks: BackgroundTasks) -> Dict:
         return loop.run_until_complete(indexer.index_directory(doc_dir))
     
     background_tasks.add_task(index_directory_sync)
+    _invalidate_search_caches()
+    background_tasks.add_task(_invalidate_search_caches)
     
     return {
         "status": "reindexing",
@@ -143,7 +143,7 @@ async def process_query(request: QueryRequest) -> QueryResponse:
                     total_time_ms=(time.time() - start_time) * 1000
                 )
             )
-            query_logger.log_query(query_log)
+            await asyncio.to_thread(query_logger.log_query, query_log)
 
             return QueryResponse(
                 query=request.query,
@@ -156,7 +156,8 @@ async def process_query(request: QueryRequest) -> QueryResponse:
         # 1. Retrieve relevant documents
         search_start = time.time()
         retriever = get_retriever()
-        evidences = retriever.retrieve(
+        evidences = await asyncio.to_thread(
+            retriever.retrieve,
             request.query,
             limit=config.TOPK_BM25 + config.TOPK_VECTOR
         )
@@ -180,7 +181,7 @@ async def process_query(request: QueryRequest) -> QueryResponse:
                     total_time_ms=(time.time() - start_time) * 1000
                 )
             )
-            query_logger.log_query(query_log)
+            await asyncio.to_thread(query_logger.log_query, query_log)
 
             return QueryResponse(
                 query=request.query,
@@ -194,7 +195,7 @@ async def process_query(request: QueryRequest) -> QueryResponse:
         # 2. Rerank if available
         rerank_start = time.time()
         reranker = get_reranker()
-        if reranker.model or (reranker.use_onnx and hasattr(reranker, 'ort_session')):
+        if reranker.is_ready():
             evidences = reranker.rerank(
                 request.query,
                 evidences,
@@ -305,7 +306,7 @@ async def process_query(request: QueryRequest) -> QueryResponse:
             error_info=error_info
         )
 
-        query_logger.log_query(query_log)
+        await asyncio.to_thread(query_logger.log_query, query_log)
 
         # 9. Create final response
         return QueryResponse(
@@ -348,7 +349,7 @@ async def process_query(request: QueryRequest) -> QueryResponse:
                 total_time_ms=(time.time() - start_time) * 1000
             )
         )
-        query_logger.log_query(query_log)
+        await asyncio.to_thread(query_logger.log_query, query_log)
 
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -357,14 +358,14 @@ async def process_query_stream(request: QueryRequest):
     """Process query with streaming response"""
     try:
         # Get evidences
-        evidences = retriever.retrieve(request.query)
+        evidences = await asyncio.to_thread(retriever.retrieve, request.query)
         
         if not evidences:
             yield {"error": "no_evidence"}
             return
         
         # Rerank if available
-        if reranker.model:
+        if reranker.is_ready():
             evidences = reranker.rerank(request.query, evidences)
         
         # Stream generation
@@ -394,7 +395,7 @@ async def health_check():
             "status": "healthy" if ollama_healthy else "degraded",
             "ollama": ollama_healthy,
             "retriever": True,
-            "reranker": reranker.model is not None
+            "reranker": reranker.is_ready()
         }
     except Exception as e:
         return {
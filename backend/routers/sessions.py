@@ -178,7 +178,7 @@ async def stream_response(session_id: str, turn_id: str, query: str,
     try:
         # 검색 수행
         retriever = HybridRetriever()
-        evidences = retriever.retrieve(query, limit=5)
+        evidences = await asyncio.to_thread(retriever.retrieve, query, limit=5)
         
         # 생성기 초기화
         generator = OllamaGenerator()
@@ -324,7 +324,7 @@ async def generate_response(session_id: str, turn_id: str, query: str,
     formatter = AnswerFormatter()
     
     # 검색
-    evidences = retriever.retrieve(query, limit=5)
+    evidences = await asyncio.to_thread(retriever.retrieve, query, limit=5)
     
     # 생성 (기존 RAG 시스템 사용)
     response = await generator.generate(
@@ -0,0 +1,144 @@
+"""
+질의 임베딩 유사도 기반 답변 캐시
+"""
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+
+from config import config
+
+logger = logging.getLogger(__name__)
+
+PartitionKey = Tuple[str, Tuple[str, ...]]
+
+
+@dataclass
+class _Partition:
+    """Cached answers of one (session, document scope) pair, least recently used first"""
+    entries: "OrderedDict[int, Tuple[float, Dict[str, Any]]]" = field(default_factory=OrderedDict)
+    embeddings: Dict[int, np.ndarray] = field(default_factory=dict)
+
+
+class SemanticCache:
+    """In-process cache returning stored answers for near-duplicate queries
+
+    Embeddings are L2-normalized so cosine similarity is a dot product.
+    Each (session, document scope) partition holds a bounded number of
+    entries with a TTL and LRU eviction.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_entries: int = 64,
+        threshold: float = 0.92
+    ):
+        self.ttl = ttl_seconds
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self._partitions: Dict[PartitionKey, _Partition] = {}
+        self._next_id = 0
+
+    @staticmethod
+    def _key(session_id: str, doc_ids: Optional[Iterable[str]]) -> PartitionKey:
+        return session_id, tuple(sorted(doc_ids or ()))
+
+    @staticmethod
+    def _normalize(embedding: Any) -> Optional[np.ndarray]:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        if not norm:
+            return None
+        return vector / norm
+
+    def get(
+        self,
+        session_id: str,
+        doc_ids: Optional[Iterable[str]],
+        embedding: Any,
+        threshold: Optional[float] = None
+    ) -> Optional[Tuple[Dict[str, Any], float]]:
+        """Get the most similar live entry and its similarity, if above the threshold"""
+        partition = self._partitions.get(self._key(session_id, doc_ids))
+        query = self._normalize(embedding)
+        if partition is None or query is None:
+            return None
+
+        self._expire(partition)
+        if not partition.entries:
+            return None
+
+        ids = list(partition.entries)
+        if partition.embeddings[ids[0]].shape != query.shape:
+            return None
+        matrix = np.stack([partition.embeddings[i] for i in ids])
+
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        similarity = float(scores[best])
+        if similarity < (self.threshold if threshold is None else threshold):
+            return None
+
+        entry_id = ids[best]
+        partition.entries.move_to_end(entry_id)
+        return partition.entries[entry_id][1], similarity
+
+    def put(
+        self,
+        session_id: str,
+        doc_ids: Optional[Iterable[str]],
+        embedding: Any,
+        value: Dict[str, Any]
+    ):
+        """Store an answer under its query embedding"""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        key = self._key(session_id, doc_ids)
+        partition = self._partitions.setdefault(key, _Partition())
+        self._expire(partition)
+        # 임베딩 차원이 바뀌면 (임베더 교체) 기존 항목은 비교 불가
+        if partition.embeddings and next(iter(partition.embeddings.values())).shape != vector.shape:
+            partition.entries.clear()
+            partition.embeddings.clear()
+
+        entry_id = self._next_id
+        self._next_id += 1
+        partition.entries[entry_id] = (time.time(), value)
+        partition.embeddings[entry_id] = vector
+
+        while len(partition.entries) > self.max_entries:
+            evicted, _ = partition.entries.popitem(last=False)
+            del partition.embeddings[evicted]
+
+    def invalidate_session(self, session_id: str):
+        """Drop all entries of a session"""
+        for key in [k for k in self._partitions if k[0] == session_id]:
+            del self._partitions[key]
+
+    def clear(self):
+        """Drop all entries, e.g. after the document index changed"""
+        self._partitions.clear()
+
+    def size(self) -> int:
+        return sum(len(p.entries) for p in self._partitions.values())
+
+    def _expire(self, partition: _Partition):
+        cutoff = time.time() - self.ttl
+        expired = [i for i, (stored_at, _) in partition.entries.items() if stored_at < cutoff]
+        for entry_id in expired:
+            del partition.entries[entry_id]
+            del partition.embeddings[entry_id]
+
+
+# 싱글톤 인스턴스
+semantic_cache = SemanticCache(
+    ttl_seconds=config.SEMANTIC_CACHE_TTL_S,
+    max_entries=config.SEMANTIC_CACHE_MAX_ENTRIES,
+    threshold=config.SEMANTIC_CACHE_THRESHOLD
+)
@@ -1,7 +1,7 @@
 import json
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime, timedelta
 from uuid import uuid4
 import logging
@@ -24,6 +24,8 @@ class SessionManager:
         self.active_sessions: Dict[str, ChatSession] = {}
         self._lock = asyncio.Lock()
         self._save_queue = asyncio.Queue()
+        # Sessions already waiting in the save queue; one write covers all their changes
+        self._pending_saves: Set[str] = set()
         self._save_task = None
         
     async def initialize(self):
@@ -51,6 +53,8 @@ class SessionManager:
         while True:
             try:
                 session_id = await self._save_queue.get()
+                # Changes made while this write runs queue a fresh save
+                self._pending_saves.discard(session_id)
                 if session_id in self.active_sessions:
                     await self._save_session(session_id)
             except asyncio.CancelledError:
@@ -87,6 +91,13 @@ class SessionManager:
         except Exception as e:
             logger.error(f"Failed to save session {session_id}: {e}")
     
+    def _schedule_save(self, session_id: str):
+        """Queue a session for saving unless a save is already pending"""
+        if session_id in self._pending_saves:
+            return
+        self._pending_saves.add(session_id)
+        self._save_queue.put_nowait(session_id)
+    
     async def _save_all_sessions(self):
         """모든 활성 세션 저장"""
         for session_id in self.active_sessions:
@@ -142,7 +153,7 @@ class SessionManager:
             if title:
                 session.title = title
             # 저장 큐에 추가
-            await self._save_queue.put(session.id)
+            self._schedule_save(session.id)
             
             logger.info(f"Created new session: {session.id}")
             return session
@@ -189,7 +200,7 @@ class SessionManager:
             session.updated_at = datetime.now()
             
             # 저장 큐에 추가
-            await self._save_queue.put(session_id)
+            self._schedule_save(session_id)
             
             return session
     
@@ -277,10 +288,37 @@ class SessionManager:
                 session.conversation_summary = content
             
             # 저장 큐에 추가
-            await self._save_queue.put(session_id)
+            self._schedule_save(session_id)
             
             return message
 
+    async def record_interrupt(
+        self,
+        session_id: str,
+        content: str,
+        metadata: Dict[str, Any]
+    ) -> Optional[bool]:
+        """중단 메시지 추가 (직전 메시지가 이미 중단 기록이면 생략)
+
+        Returns None when the session does not exist, False when skipped.
+        """
+        async with self._lock:
+            session = self.active_sessions.get(session_id)
+            if not session:
+                return None
+
+            if session.messages:
+                last = session.messages[-1]
+                # 중단 메시지는 항상 같은 문구로 시작하므로 본문 전체를 검색하지 않음
+                if (last.metadata and last.metadata.get('interrupted')) or (
+                    isinstance(last.content, str) and last.content.startswith(content.rstrip('.'))
+                ):
+                    return False
+
+            session.add_message("assistant", content, metadata=metadata)
+            self._schedule_save(session_id)
+            return True
+
     async def add_memory_facts(
         self,
         session_id: str,
@@ -296,7 +334,7 @@ class SessionManager:
                 return False
 
             session.add_memory_facts(facts)
-            await self._save_queue.put(session_id)
+            self._schedule_save(session_id)
             return True
     
     async def get_session_context(
@@ -321,7 +359,7 @@ class SessionManager:
             session.clear_messages()
             
             # 저장 큐에 추가
-            await self._save_queue.put(session_id)
+            self._schedule_save(session_id)
             
             return True
     
@@ -353,7 +391,7 @@ class SessionManager:
             session = self._dict_to_session(session_data)
             async with self._lock:
                 self.active_sessions[session.id] = session
-                await self._save_queue.put(session.id)
+                self._schedule_save(session.id)
             return session
         except Exception as e:
             logger.error(f"Failed to import session: {e}")
@@ -1,5 +1,7 @@
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List
+from collections import OrderedDict
 from functools import lru_cache, wraps
+import threading
 import time
 import hashlib
 import json
@@ -8,29 +10,42 @@ import logging
 logger = logging.getLogger(__name__)
 
 class TTLCache:
-    """Simple TTL cache implementation"""
+    """Simple TTL cache implementation
+
+    With max_size set, the least recently used entry is evicted on overflow.
+    """
     
-    def __init__(self, ttl_seconds: int = 300):
-        self.cache = {}
+    def __init__(self, ttl_seconds: int = 300, max_size: Optional[int] = None):
+        self.cache: "OrderedDict[Any, Any]" = OrderedDict()
         self.ttl = ttl_seconds
+        self.max_size = max_size
+        self._lock = threading.Lock()
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Any) -> Optional[Any]:
         """Get value from cache"""
-        if key in self.cache:
-            value, timestamp = self.cache[key]
-            if time.time() - timestamp < self.ttl:
-                return value
-            else:
-                del self.cache[key]
-        return None
-    
-    def set(self, key: str, value: Any):
+        with self._lock:
+            if key in self.cache:
+                value, timestamp = self.cache[key]
+                if time.time() - timestamp < self.ttl:
+                    self.cache.move_to_end(key)
+                    return value
+                else:
+                    del self.cache[key]
+            return None
+    
+    def set(self, key: Any, value: Any):
         """Set value in cache"""
-        self.cache[key] = (value, time.time())
+        with self._lock:
+            self.cache[key] = (value, time.time())
+            self.cache.move_to_end(key)
+            if self.max_size is not None:
+                while len(self.cache) > self.max_size:
+                    self.cache.popitem(last=False)
     
     def clear(self):
         """Clear all cache entries"""
-        self.cache.clear()
+        with self._lock:
+            self.cache.clear()
     
     def size(self) -> int:
         """Get cache size"""
@@ -40,6 +55,7 @@ class TTLCache:
 query_cache = TTLCache(ttl_seconds=600)  # 10 minutes
 embedding_cache = TTLCache(ttl_seconds=3600)  # 1 hour
 document_cache = TTLCache(ttl_seconds=1800)  # 30 minutes
+retrieval_cache = TTLCache(ttl_seconds=20, max_size=2048)  # 20 seconds, hybrid search results
 
 def cache_key(*args, **kwargs) -> str:
     """Generate cache key from arguments"""
@@ -179,6 +195,9 @@ def clear_all_caches() -> List[str]:
     document_cache.clear()
     cleared.append("document_cache")
     
+    retrieval_cache.clear()
+    cleared.append("retrieval_cache")
+    
     query_result_cache.clear()
     cleared.append("query_result_cache")
     
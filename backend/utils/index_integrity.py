@@ -5,6 +5,7 @@ import os
 import shutil
 import hashlib
 import json
+import zlib
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
@@ -20,18 +21,26 @@ class IndexIntegrityChecker:
         self.index_dir = Path(index_dir)
         self.backup_dir = backup_dir or (self.index_dir.parent / "index_backup")
         self.integrity_file = self.index_dir / ".integrity.json"
+        # (mtime, size) of each file as of the last successful verification
+        self.verified_stats_file = self.index_dir / ".integrity_cache.json"
         
-    def calculate_checksum(self, file_path: Path) -> str:
-        """Calculate MD5 checksum of a file"""
+    def calculate_checksum(self, file_path: Path, algorithm: str = "crc32") -> str:
+        """Calculate checksum of a file (crc32, or md5 for legacy snapshots)"""
         if not file_path.exists():
             return ""
         
-        hash_md5 = hashlib.md5()
         try:
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
+                if algorithm == "md5":
+                    hash_md5 = hashlib.md5()
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        hash_md5.update(chunk)
+                    return hash_md5.hexdigest()
+                
+                crc = 0
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    crc = zlib.crc32(chunk, crc)
+                return f"{crc:08x}"
         except Exception as e:
             logger.warning(f"Failed to calculate checksum for {file_path}: {e}")
             return ""
@@ -52,6 +61,7 @@ class IndexIntegrityChecker:
         """Create integrity snapshot of current index"""
         snapshot = {
             "timestamp": str(Path().cwd().stat().st_mtime),
+            "checksum_algorithm": "crc32",
             "files": {}
         }
         
@@ -74,6 +84,9 @@ class IndexIntegrityChecker:
             with open(self.integrity_file, "w", encoding="utf-8") as f:
                 json.dump(snapshot, f, indent=2)
             
+            # A fresh snapshot describes the current files, so they count as verified
+            self._save_verified_stats(self._stat_index_files())
+            
             logger.info(f"Saved integrity snapshot with {len(snapshot['files'])} files")
             return True
         except Exception as e:
@@ -92,6 +105,34 @@ class IndexIntegrityChecker:
             logger.warning(f"Failed to load integrity snapshot: {e}")
             return None
     
+    def _stat_index_files(self) -> Dict[str, List[int]]:
+        """Get (mtime_ns, size) for every index file"""
+        stats = {}
+        for file_path in self.get_index_files():
+            st = file_path.stat()
+            stats[str(file_path.relative_to(self.index_dir))] = [st.st_mtime_ns, st.st_size]
+        return stats
+    
+    def _load_verified_stats(self) -> Optional[Dict[str, List[int]]]:
+        """Load file stats recorded at the last successful verification"""
+        try:
+            if not self.verified_stats_file.exists():
+                return None
+            
+            with open(self.verified_stats_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.debug(f"Failed to load verified stats: {e}")
+            return None
+    
+    def _save_verified_stats(self, stats: Dict[str, List[int]]):
+        """Record file stats after a successful verification"""
+        try:
+            with open(self.verified_stats_file, "w", encoding="utf-8") as f:
+                json.dump(stats, f)
+        except Exception as e:
+            logger.debug(f"Failed to save verified stats: {e}")
+    
     def verify_integrity(self) -> Tuple[bool, List[str]]:
         """Verify index integrity against saved snapshot"""
         issues = []
@@ -102,6 +143,14 @@ class IndexIntegrityChecker:
             issues.append("No integrity snapshot found")
             return False, issues
         
+        # Skip checksumming when no file changed since the last verification
+        current_stats = self._stat_index_files()
+        if current_stats and current_stats == self._load_verified_stats():
+            logger.debug("Index files unchanged since last verification")
+            return True, issues
+        
+        checksum_algorithm = saved_snapshot.get("checksum_algorithm", "md5")
+        
         # Get current state
         current_files = {str(f.relative_to(self.index_dir)): f 
                         for f in self.get_index_files()}
@@ -117,7 +166,7 @@ class IndexIntegrityChecker:
             saved_info = saved_files[rel_path]
             
             # Check checksum
-            current_checksum = self.calculate_checksum(file_path)
+            current_checksum = self.calculate_checksum(file_path, checksum_algorithm)
             if current_checksum != saved_info.get("checksum", ""):
                 issues.append(f"Checksum mismatch: {rel_path}")
             
@@ -133,6 +182,7 @@ class IndexIntegrityChecker:
         
         is_valid = len(issues) == 0
         if is_valid:
+            self._save_verified_stats(current_stats)
             logger.info("Index integrity verification passed")
         else:
             logger.warning(f"Index integrity verification failed: {len(issues)} issues")
@@ -4,14 +4,22 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict, field
+import heapq
+import math
 import os
+import threading
+import numpy as np
+import orjson
 import psutil
 import traceback
 
 logger = logging.getLogger(__name__)
 
+# Per-day running totals, stored next to that day's query logs
+ROLLUP_FILENAME = "stats.json"
+
 
 @dataclass
 class SearchResult:
@@ -132,6 +140,63 @@ class QueryLog:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class LogColumns:
+    """Column-oriented view of loaded logs for vectorized filtering
+
+    Each array holds one metric for every record, in record order, so
+    filters become boolean masks and only matching records are revisited.
+    """
+    records: List[Dict]
+    confidence: np.ndarray
+    hallucination: np.ndarray
+    generic: np.ndarray
+    source_count: np.ndarray
+    is_normal: np.ndarray
+    total_time_ms: np.ndarray
+    memory_mb: np.ndarray
+    total_tokens: np.ndarray
+
+    @classmethod
+    def from_logs(cls, logs: List[Dict]) -> "LogColumns":
+        """Build columns from log dicts in a single pass"""
+        confidence = []
+        hallucination = []
+        generic = []
+        source_count = []
+        is_normal = []
+        total_time_ms = []
+        memory_mb = []
+        total_tokens = []
+
+        for log in logs:
+            qual = log.get("quality_metrics", {})
+            perf = log.get("performance_metrics", {})
+            confidence.append(qual.get("confidence_score", 0))
+            hallucination.append(bool(qual.get("hallucination_detected")))
+            generic.append(bool(qual.get("generic_response")))
+            source_count.append(qual.get("source_count", 0))
+            is_normal.append(log.get("query_type") == "normal")
+            total_time_ms.append(perf.get("total_time_ms", 0))
+            memory_mb.append(perf.get("memory_used_mb", 0))
+            total_tokens.append(perf.get("total_tokens", 0))
+
+        return cls(
+            records=logs,
+            confidence=np.array(confidence, dtype=np.float64),
+            hallucination=np.array(hallucination, dtype=bool),
+            generic=np.array(generic, dtype=bool),
+            source_count=np.array(source_count, dtype=np.int64),
+            is_normal=np.array(is_normal, dtype=bool),
+            total_time_ms=np.array(total_time_ms, dtype=np.float64),
+            memory_mb=np.array(memory_mb, dtype=np.float64),
+            total_tokens=np.array(total_tokens, dtype=np.int64)
+        )
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+
 class QueryLogger:
     """Enhanced centralized query logging with comprehensive metrics"""
 
@@ -147,6 +212,9 @@ class QueryLogger:
         # Performance tracking
         self._process = psutil.Process()
 
+        # Serializes read-modify-write of the daily rollup files
+        self._rollup_lock = threading.Lock()
+
         logger.info(f"QueryLogger initialized: {self.today_dir}")
 
     def log_query(self, query_log: QueryLog):
@@ -159,9 +227,12 @@ class QueryLogger:
             # Convert dataclass to dict (handle nested dataclasses)
             log_dict = self._dataclass_to_dict(query_log)
 
-            # Save to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(log_dict, f, ensure_ascii=False, indent=2)
+            # Save to file and fold into the day's running totals together,
+            # so a concurrent rebuild never counts the log twice
+            with self._rollup_lock:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(log_dict, f, ensure_ascii=False, indent=2)
+                self._update_rollup(self.today_dir, log_dict)
 
             # Also log summary to console
             self._log_summary(query_log)
@@ -297,13 +368,25 @@ class QueryLogger:
 
         logger.info("=" * 80)
 
+    def log_path(self, date: Optional[str] = None) -> Path:
+        """Get the directory holding query logs for a date"""
+        if date is None:
+            date = datetime.now().strftime("%Y-%m-%d")
+        return self.log_dir / date
+
     def load_logs(
         self,
         date: Optional[str] = None,
         limit: Optional[int] = None,
-        query_type: Optional[str] = None
+        query_type: Optional[str] = None,
+        prefilter: Optional[bytes] = None
     ) -> List[Dict]:
-        """Load query logs with filtering"""
+        """Load query logs with filtering
+
+        Args:
+            prefilter: Byte string that must appear in the raw log file;
+                files without it are skipped before JSON parsing
+        """
         if date is None:
             date = datetime.now().strftime("%Y-%m-%d")
 
@@ -312,96 +395,236 @@ class QueryLogger:
             return []
 
         logs = []
-        for filepath in sorted(report_dir.glob("query_*.json"), reverse=True):
+        for filepath in self._iter_log_files(report_dir, limit):
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    log = json.load(f)
+                with open(filepath, 'rb', buffering=0) as f:
+                    raw = f.read()
+
+                if prefilter is not None and prefilter not in raw:
+                    continue
 
-                    # Apply filters
-                    if query_type and log.get("query_type") != query_type:
-                        continue
+                try:
+                    log = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # json.dump writes NaN/Infinity, which orjson rejects
+                    log = json.loads(raw)
 
-                    logs.append(log)
+                # Apply filters
+                if query_type and log.get("query_type") != query_type:
+                    continue
+
+                logs.append(log)
 
-                    if limit and len(logs) >= limit:
-                        break
+                if limit and len(logs) >= limit:
+                    break
             except Exception as e:
                 logger.warning(f"Failed to load log {filepath}: {e}")
 
         return logs
 
-    def get_statistics(self, date: Optional[str] = None) -> Dict:
-        """Calculate comprehensive statistics from logs"""
-        logs = self.load_logs(date)
+    def load_logs_columnar(self, date: Optional[str] = None) -> LogColumns:
+        """Load all logs for a date as columns"""
+        return LogColumns.from_logs(self.load_logs(date))
 
-        if not logs:
-            return {"error": "No logs found"}
+    @staticmethod
+    def _empty_rollup() -> Dict:
+        """Running totals from which daily statistics are derived"""
+        return {
+            "count": 0,
+            "query_types": {},
+            "total_time_ms": 0,
+            "total_tokens": 0,
+            "search_time_ms": 0,
+            "generation_time_ms": 0,
+            "source_count": 0,
+            "evidence_count": 0,
+            "confidence": 0,
+            "hallucinations": 0,
+            "generic_responses": 0,
+            "high_confidence": 0,
+            "errors": 0
+        }
 
-        total = len(logs)
-        query_types = {}
-        total_time = 0
-        total_tokens = 0
-        total_sources = 0
-        total_evidences = 0
-        errors = 0
-        hallucinations = 0
-        generic_responses = 0
-        high_confidence = 0
-
-        confidence_scores = []
-        search_times = []
-        generation_times = []
+    @staticmethod
+    def _finite(value: Any) -> float:
+        """Get a metric value, treating missing or non-finite values as 0"""
+        if isinstance(value, (int, float)) and math.isfinite(value):
+            return value
+        return 0
+
+    @classmethod
+    def _accumulate(cls, rollup: Dict, log: Dict):
+        """Add a single log entry to running totals"""
+        finite = cls._finite
+        rollup["count"] += 1
+
+        # Query types
+        qtype = log.get("query_type", "normal")
+        query_types = rollup["query_types"]
+        query_types[qtype] = query_types.get(qtype, 0) + 1
+
+        # Performance
+        perf = log.get("performance_metrics", {})
+        rollup["total_time_ms"] += finite(perf.get("total_time_ms", 0))
+        rollup["total_tokens"] += finite(perf.get("total_tokens", 0))
+        rollup["search_time_ms"] += finite(perf.get("search_time_ms", 0))
+        rollup["generation_time_ms"] += finite(perf.get("generation_time_ms", 0))
+
+        # Quality
+        qual = log.get("quality_metrics", {})
+        confidence = finite(qual.get("confidence_score", 0))
+        rollup["source_count"] += finite(qual.get("source_count", 0))
+        rollup["evidence_count"] += finite(qual.get("evidence_count", 0))
+        rollup["confidence"] += confidence
+
+        if qual.get("hallucination_detected"):
+            rollup["hallucinations"] += 1
+        if qual.get("generic_response"):
+            rollup["generic_responses"] += 1
+        if confidence >= 0.7:
+            rollup["high_confidence"] += 1
+
+        # Errors
+        if log.get("error_info", {}).get("has_error"):
+            rollup["errors"] += 1
+
+    def _read_rollup(self, report_dir: Path) -> Optional[Dict]:
+        """Read a day's rollup file if present"""
+        try:
+            with open(report_dir / ROLLUP_FILENAME, 'rb') as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Failed to read rollup in {report_dir}: {e}")
+            return None
+
+    def _write_rollup(self, report_dir: Path, rollup: Dict):
+        """Atomically replace a day's rollup file"""
+        tmp_path = report_dir / f".{ROLLUP_FILENAME}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(rollup))
+        os.replace(tmp_path, report_dir / ROLLUP_FILENAME)
+
+    def _update_rollup(self, report_dir: Path, log_dict: Dict):
+        """Add a newly written log to its day's rollup; caller holds _rollup_lock"""
+        try:
+            rollup = self._read_rollup(report_dir) or self._empty_rollup()
+            self._accumulate(rollup, log_dict)
+            self._write_rollup(report_dir, rollup)
+        except Exception as e:
+            # get_statistics rebuilds the rollup when its count is off
+            logger.warning(f"Failed to update rollup in {report_dir}: {e}")
+
+    @staticmethod
+    def _is_log_file(name: str) -> bool:
+        """Check whether a file name is a query log (query_*.json)"""
+        return name.startswith("query_") and name.endswith(".json")
+
+    @classmethod
+    def _iter_log_files(cls, report_dir: Path, limit: Optional[int] = None) -> Iterator[str]:
+        """Yield query log file paths, newest first
+
+        With a limit only the newest `limit` paths are selected up front;
+        the remainder is sorted only if the caller keeps iterating.
+        """
+        with os.scandir(report_dir) as entries:
+            paths = [entry.path for entry in entries if cls._is_log_file(entry.name)]
+
+        if limit and limit < len(paths):
+            newest = heapq.nlargest(limit, paths)
+            yield from newest
+            cutoff = newest[-1]
+            yield from sorted((p for p in paths if p < cutoff), reverse=True)
+        else:
+            paths.sort(reverse=True)
+            yield from paths
+
+    @classmethod
+    def _count_log_files(cls, report_dir: Path) -> int:
+        """Count query log files without reading them"""
+        with os.scandir(report_dir) as entries:
+            return sum(1 for entry in entries if cls._is_log_file(entry.name))
+
+    def logs_stamp(self, date: Optional[str] = None) -> Tuple[int, int]:
+        """Get (count, newest mtime_ns) of a date's query logs
+
+        Only query_*.json files count, so derived files written into the
+        same directory (stats.json, report.html) leave the stamp unchanged.
+        """
+        count = 0
+        newest = 0
+        try:
+            with os.scandir(self.log_path(date)) as entries:
+                for entry in entries:
+                    if self._is_log_file(entry.name):
+                        count += 1
+                        newest = max(newest, entry.stat().st_mtime_ns)
+        except FileNotFoundError:
+            pass
+        return count, newest
+
+    def _load_rollup(self, date: str) -> Optional[Dict]:
+        """Get a day's rollup, rebuilding it from the logs if it is stale"""
+        report_dir = self.log_path(date)
+        if not report_dir.exists():
+            return None
 
-        for log in logs:
-            # Query types
-            qtype = log.get("query_type", "normal")
-            query_types[qtype] = query_types.get(qtype, 0) + 1
+        rollup = self._read_rollup(report_dir)
+        if rollup is not None and rollup.get("count") == self._count_log_files(report_dir):
+            return rollup
 
-            # Performance
-            perf = log.get("performance_metrics", {})
-            total_time += perf.get("total_time_ms", 0)
-            total_tokens += perf.get("total_tokens", 0)
-            search_times.append(perf.get("search_time_ms", 0))
-            generation_times.append(perf.get("generation_time_ms", 0))
+        # Missing or out of date (e.g. written by another process): rebuild.
+        # The lock keeps log_query from adding a log between the count and
+        # the write, which would otherwise be counted twice
+        with self._rollup_lock:
+            rollup = self._read_rollup(report_dir)
+            if rollup is not None and rollup.get("count") == self._count_log_files(report_dir):
+                return rollup
 
-            # Quality
-            qual = log.get("quality_metrics", {})
-            total_sources += qual.get("source_count", 0)
-            total_evidences += qual.get("evidence_count", 0)
-            confidence_scores.append(qual.get("confidence_score", 0))
+            rollup = self._empty_rollup()
+            for log in self.load_logs(date):
+                self._accumulate(rollup, log)
 
-            if qual.get("hallucination_detected"):
-                hallucinations += 1
-            if qual.get("generic_response"):
-                generic_responses += 1
-            if qual.get("confidence_score", 0) >= 0.7:
-                high_confidence += 1
+            try:
+                self._write_rollup(report_dir, rollup)
+            except Exception as e:
+                logger.warning(f"Failed to save rollup in {report_dir}: {e}")
 
-            # Errors
-            if log.get("error_info", {}).get("has_error"):
-                errors += 1
+        return rollup
+
+    def get_statistics(self, date: Optional[str] = None) -> Dict:
+        """Calculate comprehensive statistics from the day's rollup"""
+        if date is None:
+            date = datetime.now().strftime("%Y-%m-%d")
+
+        rollup = self._load_rollup(date)
+        if not rollup or not rollup["count"]:
+            return {"error": "No logs found"}
+
+        total = rollup["count"]
 
         return {
             "total_queries": total,
-            "query_types": query_types,
+            "query_types": rollup["query_types"],
             "performance": {
-                "avg_total_time_ms": total_time / total if total > 0 else 0,
-                "avg_search_time_ms": sum(search_times) / len(search_times) if search_times else 0,
-                "avg_generation_time_ms": sum(generation_times) / len(generation_times) if generation_times else 0,
-                "total_tokens": total_tokens,
-                "avg_tokens_per_query": total_tokens / total if total > 0 else 0
+                "avg_total_time_ms": rollup["total_time_ms"] / total,
+                "avg_search_time_ms": rollup["search_time_ms"] / total,
+                "avg_generation_time_ms": rollup["generation_time_ms"] / total,
+                "total_tokens": rollup["total_tokens"],
+                "avg_tokens_per_query": rollup["total_tokens"] / total
             },
             "quality": {
-                "avg_confidence": sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0,
-                "high_confidence_rate": high_confidence / total if total > 0 else 0,
-                "avg_sources_per_query": total_sources / total if total > 0 else 0,
-                "avg_evidences_per_query": total_evidences / total if total > 0 else 0,
-                "hallucination_rate": hallucinations / total if total > 0 else 0,
-                "generic_response_rate": generic_responses / total if total > 0 else 0
+                "avg_confidence": rollup["confidence"] / total,
+                "high_confidence_rate": rollup["high_confidence"] / total,
+                "avg_sources_per_query": rollup["source_count"] / total,
+                "avg_evidences_per_query": rollup["evidence_count"] / total,
+                "hallucination_rate": rollup["hallucinations"] / total,
+                "generic_response_rate": rollup["generic_responses"] / total
             },
             "errors": {
-                "error_count": errors,
-                "error_rate": errors / total if total > 0 else 0
+                "error_count": rollup["errors"],
+                "error_rate": rollup["errors"] / total
             }
         }
 
@@ -414,7 +637,11 @@ class QueryLogger:
         limit: int = 50
     ) -> List[Dict]:
         """Search logs with various filters"""
-        logs = self.load_logs(date, limit=limit * 2)  # Load more for filtering
+        logs = self.load_logs(
+            date,
+            limit=limit * 2,  # Load more for filtering
+            prefilter=self._raw_search_needle(query_text)
+        )
 
         filtered = []
         for log in logs:
@@ -441,6 +668,25 @@ class QueryLogger:
 
         return filtered
 
+    @staticmethod
+    def _raw_search_needle(query_text: Optional[str]) -> Optional[bytes]:
+        """Get bytes that any log matching query_text must contain verbatim
+
+        Logs are written with ensure_ascii=False, so caseless text (Korean,
+        digits, punctuation) appears as-is in the file. Returns None when the
+        text has cased letters or characters JSON would escape.
+        """
+        if not query_text:
+            return None
+
+        needle = query_text.lower()
+        if needle != needle.upper():
+            return None
+        if any(c in '"\\' or c < ' ' for c in needle):
+            return None
+
+        return needle.encode('utf-8')
+
     def generate_report(self, date: Optional[str] = None) -> str:
         """Generate comprehensive HTML report"""
         if date is None:
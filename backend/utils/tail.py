@@ -0,0 +1,65 @@
+"""Read the end of large files without loading them"""
+
+import os
+from pathlib import Path
+from typing import Iterator, Tuple
+
+TAIL_BLOCK_SIZE = 64 * 1024
+
+def find_tail_offset(fd: int, size: int, lines: int) -> int:
+    """Find the byte offset where the last `lines` lines of a file start"""
+    if lines <= 0 or size == 0:
+        return size
+    
+    # The newline terminating the last line does not start a new line
+    pos = size
+    os.lseek(fd, size - 1, os.SEEK_SET)
+    if os.read(fd, 1) == b"\n":
+        pos -= 1
+    
+    remaining = lines
+    while pos > 0:
+        start = max(pos - TAIL_BLOCK_SIZE, 0)
+        os.lseek(fd, start, os.SEEK_SET)
+        block = os.read(fd, pos - start)
+        
+        idx = len(block)
+        while True:
+            idx = block.rfind(b"\n", 0, idx)
+            if idx < 0:
+                break
+            remaining -= 1
+            if remaining == 0:
+                return start + idx + 1
+        
+        pos = start
+    
+    return 0
+
+def open_tail(path: Path, lines: int) -> Tuple[int, int, int]:
+    """Open a file positioned at the start of its last lines
+    
+    Returns (fd, offset, size); the caller owns the descriptor.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        offset = find_tail_offset(fd, size, lines)
+        os.lseek(fd, offset, os.SEEK_SET)
+        return fd, offset, size
+    except Exception:
+        os.close(fd)
+        raise
+
+def stream_tail(fd: int, offset: int, size: int) -> Iterator[bytes]:
+    """Yield file contents from offset to size in blocks, then close"""
+    try:
+        remaining = size - offset
+        while remaining > 0:
+            block = os.read(fd, min(TAIL_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+    finally:
+        os.close(fd)
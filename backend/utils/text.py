@@ -1,9 +1,18 @@
 import re
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import unicodedata
 from rapidfuzz import fuzz
 import hashlib
 
+@lru_cache(maxsize=4096)
+def nfc_doc_id(doc_id: str) -> str:
+    """NFC-normalize a document ID (filenames may arrive as NFD)"""
+    # ASCII is already NFC
+    if doc_id.isascii():
+        return doc_id
+    return unicodedata.normalize('NFC', doc_id)
+
 def normalize_korean(text: str) -> str:
     """Normalize Korean text"""
     # Normalize Unicode
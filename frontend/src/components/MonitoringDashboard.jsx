@@ -27,15 +27,11 @@ const MonitoringDashboard = () => {
       const queriesData = await queriesRes.json();
       setRecentQueries(queriesData);
 
-      // Fetch quality issues
-      const qualityRes = await fetch(`${API_BASE}/admin/logs/quality-issues${dateParam}`);
-      const qualityData = await qualityRes.json();
-      setQualityIssues(qualityData);
-
-      // Fetch performance issues
-      const perfRes = await fetch(`${API_BASE}/admin/logs/performance-issues${dateParam}`);
-      const perfData = await perfRes.json();
-      setPerformanceIssues(perfData);
+      // Fetch quality and performance issues (single log scan)
+      const issuesRes = await fetch(`${API_BASE}/admin/logs/issues${dateParam}`);
+      const issuesData = await issuesRes.json();
+      setQualityIssues(issuesData.quality);
+      setPerformanceIssues(issuesData.performance);
 
       // Fetch trends
       const trendsRes = await fetch(`${API_BASE}/admin/logs/trends?days=7`);
@@ -53,8 +53,9 @@ class RAGInstaller:
             version_str = f"{version_info.major}.{version_info.minor}.{version_info.micro}"
             print(f"✅ Python {version_str} found")
             
-            if version_info < (3, 8):
-                print("❌ Python 3.8 or later is required")
+            # asyncio.timeout (used by the chat router) needs 3.11
+            if version_info < (3, 11):
+                print("❌ Python 3.11 or later is required")
                 return False
             return True
         except Exception as e:
@@ -23,6 +23,12 @@ if ! command -v python3 &> /dev/null; then
     exit 1
 fi
 PYTHON_VERSION=$(python3 --version | awk '{print $2}')
+if ! python3 -c 'import sys; sys.exit(sys.version_info < (3, 11))'; then
+    echo -e "${RED}❌ Python 3.11 이상이 필요합니다 (현재 $PYTHON_VERSION).${NC}"
+    echo "   macOS: brew install python@3.12"
+    echo "   Ubuntu: sudo apt install python3.12"
+    exit 1
+fi
 echo -e "${GREEN}✓ Python $PYTHON_VERSION 설치됨${NC}"
 echo ""
 
@@ -33,7 +33,7 @@ trap cleanup EXIT INT TERM
 
 # Start backend
 echo -e "${GREEN}Starting backend server on http://localhost:8000${NC}"
-(cd backend && PYTHONPATH=. uvicorn main:app --reload --port 8000) &
+(cd backend && PYTHONPATH=. uvicorn main:app --reload --port 8000 --loop auto --http httptools) &
 BACKEND_PID=$!
 
 # Wait a moment for backend to start
@@ -83,7 +83,9 @@ class RAGLauncher:
         
         try:
             self.backend_process = subprocess.Popen(
-                [sys.executable, '-m', 'uvicorn', 'main:app', '--reload', '--port', '8000'],
+                [sys.executable, '-m', 'uvicorn', 'main:app', '--reload', '--port', '8000',
+                 '--loop', 'auto',
+                 '--http', 'httptools'],
                 cwd=backend_dir,
                 env=env,
                 stdout=subprocess.PIPE,
@@ -92,7 +92,7 @@ mkdir -p logs
 # 백엔드 시작
 echo ""
 echo "📦 백엔드 서버를 시작합니다..."
-(cd backend && PYTHONPATH=. uvicorn main:app --port 8000) > logs/backend.log 2>&1 &
+(cd backend && PYTHONPATH=. uvicorn main:app --port 8000 --loop auto --http httptools) > logs/backend.log 2>&1 &
 BACKEND_PID=$!
 echo "   PID: $BACKEND_PID"
 
@@ -189,5 +189,27 @@ def test_fuzzy_matching(tracker):
     text3 = "완전히 다른 텍스트입니다"
     assert not tracker._fuzzy_match(text1, text3, threshold=0.8)
 
+def test_cited_source_renumbering(formatter):
+    """Test that renumbering rewrites each citation exactly once"""
+    response = {
+        "answer": "A [2] B [3]",
+        "key_facts": ["사실 [3]", "사실 [2]"],
+        "details": "상세 [3] [2]",
+        "sources": [
+            {"doc_id": "doc1", "text_snippet": ""},
+            {"doc_id": "doc2", "text_snippet": ""},
+            {"doc_id": "doc3", "text_snippet": ""}
+        ]
+    }
+    
+    result = formatter._filter_cited_sources(response)
+    
+    # {2: 1, 3: 2} must not chain [3] -> [2] -> [1]
+    assert result["citation_map"] == {2: 1, 3: 2}
+    assert result["answer"] == "A [1] B [2]"
+    assert result["key_facts"] == ["사실 [2]", "사실 [1]"]
+    assert result["details"] == "상세 [2] [1]"
+    assert [s["doc_id"] for s in result["sources"]] == ["doc2", "doc3"]
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
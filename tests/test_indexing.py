@@ -0,0 +1,114 @@
+import pytest
+from pathlib import Path
+from unittest import mock
+import asyncio
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from config import config
+from rag.whoosh_bm25 import WhooshBM25
+from processors.indexer import DocumentIndexer
+
+def make_chunks(doc_id, count):
+    return [
+        {
+            "chunk_id": f"{doc_id}-{i}",
+            "doc_id": doc_id,
+            "text": f"예산 편성 지침 {doc_id} 항목 {i}",
+            "page": i + 1
+        }
+        for i in range(count)
+    ]
+
+@pytest.fixture
+def whoosh(tmp_path, monkeypatch):
+    """Create Whoosh index in a temporary directory"""
+    monkeypatch.setattr(config, "WHOOSH_DIR", tmp_path / "index")
+    return WhooshBM25()
+
+@pytest.fixture
+def indexer(tmp_path):
+    """Create document indexer with stubbed parsers and stores"""
+    instance = DocumentIndexer.__new__(DocumentIndexer)
+    instance.hwp_parser = mock.Mock()
+    instance.chunker = mock.Mock()
+    instance.normalizer = mock.Mock()
+    instance.normalizer.normalize_chunk.side_effect = lambda chunk: chunk
+    instance._whoosh = mock.Mock()
+    instance._whoosh.delete_document.return_value = 0
+    instance._chroma = mock.Mock()
+    instance._chroma.delete_document.return_value = 0
+    instance._embedder = mock.Mock()
+    instance._embedder.embed_batch.side_effect = lambda texts: [[0.1, 0.2] for _ in texts]
+    instance._summarizer = None
+
+    chunks_by_doc = {}
+    for name in ["a", "b"]:
+        (tmp_path / f"{name}.hwp").write_bytes(b"")
+        chunks_by_doc[name] = make_chunks(name, 2)
+
+    def parse_hwp(path):
+        doc_id = Path(path).stem
+        return {"doc_id": doc_id, "pages": [{"text": "본문"}]}
+
+    instance.hwp_parser.parse_hwp.side_effect = parse_hwp
+    instance.chunker.chunk_document.side_effect = lambda doc: chunks_by_doc[doc["doc_id"]]
+    return instance
+
+def test_bulk_index_single_writer(whoosh):
+    """Test bulk indexing with one process"""
+    whoosh.bulk_index_chunks(make_chunks("doc1", 5), procs=1)
+
+    assert whoosh.get_stats()["total_documents"] == 5
+    results = whoosh.search("예산")
+    assert {r["doc_id"] for r in results} == {"doc1"}
+
+def test_bulk_index_falls_back_to_single_writer(whoosh):
+    """Test that a failing multiprocess write is retried with a single writer"""
+    with mock.patch.object(whoosh, "_write_multiprocess", side_effect=RuntimeError("fork failed")):
+        whoosh.bulk_index_chunks(make_chunks("doc1", 3), procs=4)
+
+    assert whoosh.get_stats()["total_documents"] == 3
+
+def test_index_document_defers_whoosh(indexer, tmp_path):
+    """Test that chunks are collected instead of indexed when a batch is given"""
+    batch = []
+    result = asyncio.run(indexer.index_document(tmp_path / "a.hwp", whoosh_batch=batch))
+
+    assert result["status"] == "success"
+    assert [c["chunk_id"] for c in batch] == ["a-0", "a-1"]
+    indexer._whoosh.index_chunks.assert_not_called()
+    indexer._chroma.add_documents.assert_called_once()
+
+def test_index_directory_flushes_in_batches(indexer, tmp_path, monkeypatch):
+    """Test that directory indexing writes Whoosh in bounded batches"""
+    monkeypatch.setattr(config, "WHOOSH_BULK_BATCH_CHUNKS", 2)
+    # The batch list is cleared after each flush, so record its contents
+    written = []
+    indexer._whoosh.bulk_index_chunks.side_effect = (
+        lambda chunks: written.append([c["doc_id"] for c in chunks])
+    )
+
+    results = asyncio.run(indexer.index_directory(tmp_path, extensions=[".hwp"]))
+
+    assert [r["status"] for r in results] == ["success", "success"]
+    assert sorted(written) == [["a", "a"], ["b", "b"]]
+
+def test_index_directory_rolls_back_chroma_on_whoosh_failure(indexer, tmp_path):
+    """Test that a failed Whoosh write removes the batch from ChromaDB"""
+    def fail(chunks):
+        # Only count deletions made after the failed write
+        indexer._chroma.delete_document.reset_mock()
+        raise RuntimeError("disk full")
+
+    indexer._whoosh.bulk_index_chunks.side_effect = fail
+
+    results = asyncio.run(indexer.index_directory(tmp_path, extensions=[".hwp"]))
+
+    assert [r["status"] for r in results] == ["whoosh_error", "whoosh_error"]
+    deleted = {call.args[0] for call in indexer._chroma.delete_document.call_args_list}
+    assert deleted == {"a", "b"}
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,100 @@
+import pytest
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from utils.query_logger import (
+    QueryLogger, QueryLog, QualityMetrics, PerformanceMetrics, ErrorInfo, ROLLUP_FILENAME
+)
+
+@pytest.fixture
+def query_logger(tmp_path):
+    """Create query logger writing to a temporary directory"""
+    return QueryLogger(log_dir=str(tmp_path))
+
+def make_log(confidence=0.8, total_time_ms=100.0, has_error=False, query_type="normal"):
+    return QueryLog(
+        timestamp=datetime.now().isoformat(),
+        session_id="s1",
+        query="연차 휴가 일수",
+        query_type=query_type,
+        quality_metrics=QualityMetrics(confidence_score=confidence, source_count=2),
+        performance_metrics=PerformanceMetrics(total_time_ms=total_time_ms, total_tokens=10),
+        error_info=ErrorInfo(has_error=has_error)
+    )
+
+def read_rollup(query_logger):
+    with open(query_logger.today_dir / ROLLUP_FILENAME, encoding="utf-8") as f:
+        return json.load(f)
+
+def test_rollup_accumulates_logs(query_logger):
+    """Test that each logged query is folded into the running totals"""
+    query_logger.log_query(make_log(confidence=0.9, total_time_ms=100.0))
+    query_logger.log_query(make_log(confidence=0.5, total_time_ms=300.0, has_error=True))
+    query_logger.log_query(make_log(query_type="greeting"))
+
+    rollup = read_rollup(query_logger)
+    assert rollup["count"] == 3
+    assert rollup["query_types"] == {"normal": 2, "greeting": 1}
+    assert rollup["errors"] == 1
+
+    stats = query_logger.get_statistics()
+    assert stats["total_queries"] == 3
+    assert stats["performance"]["avg_total_time_ms"] == pytest.approx(500.0 / 3)
+    assert stats["performance"]["total_tokens"] == 30
+    assert stats["quality"]["avg_confidence"] == pytest.approx(2.2 / 3)
+    assert stats["quality"]["high_confidence_rate"] == pytest.approx(2 / 3)
+    assert stats["errors"]["error_rate"] == pytest.approx(1 / 3)
+
+def test_rollup_rebuilt_when_missing_or_stale(query_logger):
+    """Test that a missing or out-of-date rollup is rebuilt from the logs"""
+    for _ in range(3):
+        query_logger.log_query(make_log())
+    expected = query_logger.get_statistics()
+
+    (query_logger.today_dir / ROLLUP_FILENAME).unlink()
+    assert query_logger.get_statistics() == expected
+
+    # A log written by another process is not in the rollup yet
+    stale = read_rollup(query_logger)
+    query_logger.log_query(make_log())
+    with open(query_logger.today_dir / ROLLUP_FILENAME, "w", encoding="utf-8") as f:
+        json.dump(stale, f)
+
+    assert query_logger.get_statistics()["total_queries"] == 4
+    assert read_rollup(query_logger)["count"] == 4
+
+def test_rollup_skips_non_finite_metrics(query_logger):
+    """Test that NaN and infinite metrics do not poison the totals"""
+    query_logger.log_query(make_log(confidence=float("nan"), total_time_ms=float("inf")))
+    query_logger.log_query(make_log(confidence=0.6, total_time_ms=200.0))
+
+    rollup = read_rollup(query_logger)
+    assert rollup["count"] == 2
+    assert rollup["confidence"] == pytest.approx(0.6)
+    assert rollup["total_time_ms"] == pytest.approx(200.0)
+
+    # Rebuilding from the files gives the same totals
+    (query_logger.today_dir / ROLLUP_FILENAME).unlink()
+    assert query_logger.get_statistics()["quality"]["avg_confidence"] == pytest.approx(0.3)
+
+def test_rollup_consistent_under_concurrent_rebuilds(query_logger):
+    """Test that rebuilds racing with new logs never double count"""
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = []
+        for i in range(40):
+            futures.append(executor.submit(query_logger.log_query, make_log()))
+            if i % 4 == 0:
+                futures.append(executor.submit(query_logger.get_statistics))
+        for future in futures:
+            future.result()
+
+    assert read_rollup(query_logger)["count"] == 40
+    assert query_logger.get_statistics()["total_queries"] == 40
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,97 @@
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
+
+from services import semantic_cache as semantic_cache_module
+from services.semantic_cache import SemanticCache
+
+@pytest.fixture
+def cache():
+    """Create semantic cache instance"""
+    return SemanticCache(ttl_seconds=300, max_entries=2, threshold=0.9)
+
+def test_hit_above_threshold(cache):
+    """Test that a near-duplicate query returns the stored answer"""
+    cache.put("s1", ["doc1"], [1.0, 0.0, 0.0], {"answer": "A"})
+
+    hit = cache.get("s1", ["doc1"], [0.99, 0.05, 0.0])
+    assert hit is not None
+    value, similarity = hit
+    assert value == {"answer": "A"}
+    assert similarity > 0.9
+
+def test_miss_below_threshold(cache):
+    """Test that a dissimilar query misses"""
+    cache.put("s1", ["doc1"], [1.0, 0.0, 0.0], {"answer": "A"})
+
+    assert cache.get("s1", ["doc1"], [0.0, 1.0, 0.0]) is None
+    assert cache.get("s1", ["doc1"], [0.7, 0.7, 0.0], threshold=0.5) is not None
+
+def test_partitioned_by_session_and_scope(cache):
+    """Test that entries are only shared within one session and document scope"""
+    cache.put("s1", ["doc2", "doc1"], [1.0, 0.0], {"answer": "A"})
+
+    assert cache.get("s1", ["doc1", "doc2"], [1.0, 0.0]) is not None
+    assert cache.get("s1", ["doc1"], [1.0, 0.0]) is None
+    assert cache.get("s2", ["doc1", "doc2"], [1.0, 0.0]) is None
+
+def test_ttl_expiry(cache, monkeypatch):
+    """Test that entries expire after the TTL"""
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache_module.time, "time", lambda: now[0])
+    cache.put("s1", None, [1.0, 0.0], {"answer": "A"})
+
+    now[0] += 299
+    assert cache.get("s1", None, [1.0, 0.0]) is not None
+
+    now[0] += 2
+    assert cache.get("s1", None, [1.0, 0.0]) is None
+    assert cache.size() == 0
+
+def test_lru_eviction(cache):
+    """Test that the least recently used entry is evicted first"""
+    cache.put("s1", None, [1.0, 0.0, 0.0], {"answer": "A"})
+    cache.put("s1", None, [0.0, 1.0, 0.0], {"answer": "B"})
+
+    # Touch A so B becomes the least recently used
+    assert cache.get("s1", None, [1.0, 0.0, 0.0])[0] == {"answer": "A"}
+    cache.put("s1", None, [0.0, 0.0, 1.0], {"answer": "C"})
+
+    assert cache.size() == 2
+    assert cache.get("s1", None, [0.0, 1.0, 0.0]) is None
+    assert cache.get("s1", None, [1.0, 0.0, 0.0])[0] == {"answer": "A"}
+    assert cache.get("s1", None, [0.0, 0.0, 1.0])[0] == {"answer": "C"}
+
+def test_dimension_change(cache):
+    """Test that embeddings of another dimension miss and reset the partition"""
+    cache.put("s1", None, [1.0, 0.0, 0.0], {"answer": "A"})
+
+    assert cache.get("s1", None, [1.0, 0.0]) is None
+
+    cache.put("s1", None, [1.0, 0.0], {"answer": "B"})
+    assert cache.size() == 1
+    assert cache.get("s1", None, [1.0, 0.0])[0] == {"answer": "B"}
+    assert cache.get("s1", None, [1.0, 0.0, 0.0]) is None
+
+def test_zero_vector_ignored(cache):
+    """Test that zero embeddings are neither stored nor matched"""
+    cache.put("s1", None, [0.0, 0.0], {"answer": "A"})
+    assert cache.size() == 0
+    assert cache.get("s1", None, [0.0, 0.0]) is None
+
+def test_invalidate_session(cache):
+    """Test that invalidation drops every partition of one session only"""
+    cache.put("s1", ["doc1"], [1.0, 0.0], {"answer": "A"})
+    cache.put("s1", ["doc2"], [1.0, 0.0], {"answer": "B"})
+    cache.put("s2", ["doc1"], [1.0, 0.0], {"answer": "C"})
+
+    cache.invalidate_session("s1")
+
+    assert cache.get("s1", ["doc1"], [1.0, 0.0]) is None
+    assert cache.get("s1", ["doc2"], [1.0, 0.0]) is None
+    assert cache.get("s2", ["doc1"], [1.0, 0.0])[0] == {"answer": "C"}
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])